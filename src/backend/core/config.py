@@ -11,6 +11,7 @@ Requirements addressed:
 """
 
 import os
+from functools import lru_cache
 from typing import Dict, Any
 from pydantic import BaseSettings, Field
 from dotenv import load_dotenv
@@ -40,6 +41,9 @@ class Settings(BaseSettings):
     FOREIGN_EXCHANGE_API_KEY: str = Field(..., env="FOREIGN_EXCHANGE_API_KEY")
     FOREIGN_EXCHANGE_API_URL: str = Field(..., env="FOREIGN_EXCHANGE_API_URL")
     DEBUG: bool = Field(False, env="DEBUG")
+    REQUEST_ID_HEADER: str = Field("X-Request-ID", env="REQUEST_ID_HEADER")
+    RATE_LIMIT_TOKENS: int = Field(100, gt=0, env="RATE_LIMIT_TOKENS")
+    RATE_LIMIT_REFRESH_RATE: float = Field(10.0, gt=0, env="RATE_LIMIT_REFRESH_RATE")
 
     class Config:
         case_sensitive = True
@@ -57,9 +61,13 @@ class ProdSettings(Settings):
     """Settings class for the production environment."""
     pass
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Factory function to return the appropriate Settings instance based on the current environment.
+
+    The instance is built once and cached, so the environment and .env file are
+    only parsed on the first call. Use ``get_settings.cache_clear()`` to force a reload.
     
     Returns:
         Settings: An instance of the appropriate Settings class for the current environment.
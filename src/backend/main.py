@@ -20,7 +20,7 @@ from fastapi.responses import JSONResponse
 from src.backend.config import get_config, API_V1_STR, PROJECT_NAME, DEBUG, ENVIRONMENT
 from src.backend.api.v1 import api_router
 from src.backend.db.session import get_db
-from src.backend.utils.logging import setup_logging, get_logger
+from src.backend.utils.logging import setup_logging, get_logger, stop_logging
 from src.backend.utils.error_handlers import http_error_handler, validation_error_handler, setup_error_handlers
 
 # Setup logging
@@ -73,6 +73,7 @@ def create_app() -> FastAPI:
         # Perform any cleanup tasks here
         # For example, close database connections
         # await close_db_connections()
+        stop_logging()
 
     return app
 
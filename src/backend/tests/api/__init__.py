@@ -48,6 +48,7 @@ from .v1 import (
 
     # Reporting metrics tests
     test_create_reporting_metrics,
+    test_create_reporting_metrics_persists_to_db,
     test_read_reporting_metrics,
     test_update_reporting_metrics,
     test_delete_reporting_metrics,
@@ -49,6 +49,7 @@ from .test_reporting_financials import (
 
 from .test_reporting_metrics import (
     test_create_reporting_metrics,
+    test_create_reporting_metrics_persists_to_db,
     test_read_reporting_metrics,
     test_update_reporting_metrics,
     test_delete_reporting_metrics,
@@ -13,8 +13,12 @@ Requirements addressed:
    Offers a fixture for creating an async test client for API endpoint testing.
 """
 
+import asyncio
+import os
+
 import pytest
-from httpx import AsyncClient
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -23,23 +27,48 @@ from src.backend.db.session import get_db
 from src.backend.core.config import get_settings, Settings
 from src.backend.main import get_app
 
+# Identifier of the pytest-xdist worker running this process ("gw0" when not distributed)
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+
+# Set once Base.metadata.create_all has run in this process
+_tables_created = False
+
+# Pytest fixture providing one event loop for the whole test session
+@pytest.fixture(scope="session")
+def event_loop():
+    """
+    Fixture to provide a session-wide event loop.
+
+    Session-scoped async fixtures (the engine and table creation) must run on
+    the same loop as the tests that use them.
+    
+    Yields:
+        asyncio.AbstractEventLoop: The session event loop.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
 # Pytest fixture for overriding settings
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_settings() -> Settings:
     """
     Fixture to provide test-specific settings.
+
+    Each pytest-xdist worker runs in its own process and gets its own SQLite
+    file, so parallel workers never share a database.
     
     Returns:
         Settings: A Settings instance with test-specific configurations.
     """
     settings = get_settings()
-    settings.DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+    settings.DATABASE_URL = f"sqlite+aiosqlite:///./test_{XDIST_WORKER}.db"
     settings.DEBUG = True
     return settings
 
 # Pytest fixture for creating a test database engine
 @pytest.fixture(scope="session")
-def db_engine(test_settings: Settings):
+async def db_engine(test_settings: Settings):
     """
     Fixture to create and yield a test database engine.
     
@@ -55,7 +84,7 @@ def db_engine(test_settings: Settings):
         echo=True,
     )
     yield engine
-    engine.dispose()
+    await engine.dispose()
 
 # Pytest fixture for creating test database tables
 @pytest.fixture(scope="session")
@@ -63,11 +92,16 @@ async def create_tables(db_engine):
     """
     Fixture to create test database tables.
     
+    The schema is created exactly once per test process and reused by every test.
+    
     Args:
         db_engine: The test database engine fixture.
     """
+    global _tables_created
+    assert not _tables_created, "Base.metadata.create_all must only run once per test process"
     async with db_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    _tables_created = True
 
 # Pytest fixture for creating a test database session
 @pytest.fixture
@@ -89,31 +123,65 @@ async def db_session(db_engine, create_tables) -> AsyncSession:
         yield session
         await session.rollback()
 
+# Pytest fixture exposing the test database session under the name used by the API tests
+@pytest.fixture
+def db(db_session: AsyncSession) -> AsyncSession:
+    """
+    Fixture aliasing db_session for test modules that request ``db``.
+
+    Sharing the same session keeps ``expire_on_commit=False`` in effect, so
+    attributes read after a commit do not trigger a fresh SELECT.
+    
+    Args:
+        db_session: The test database session fixture.
+    
+    Returns:
+        AsyncSession: The test database session.
+    """
+    return db_session
+
+# Pytest fixture for building the FastAPI application once per test session
+@pytest.fixture(scope="session")
+def app_instance() -> FastAPI:
+    """
+    Fixture to build the FastAPI application once for the whole test session.
+
+    Route registration and middleware assembly run a single time; per-test state
+    is applied through dependency overrides in the client fixture.
+
+    Returns:
+        FastAPI: The configured FastAPI application.
+    """
+    return get_app()
+
 # Pytest fixture for creating an async test client
 @pytest.fixture
-async def client(db_session: AsyncSession, test_settings: Settings) -> AsyncClient:
+async def client(app_instance: FastAPI, db_session: AsyncSession, test_settings: Settings) -> AsyncClient:
     """
     Fixture to create and yield an async test client.
     
     Args:
+        app_instance: The session-wide FastAPI application fixture.
         db_session: The test database session fixture.
         test_settings: The test settings fixture.
     
     Yields:
         AsyncClient: The async test client.
     """
-    app = get_app()
-    
     async def override_get_db():
         yield db_session
 
     async def override_get_settings():
         return test_settings
 
-    app.dependency_overrides[get_db] = override_get_db
-    app.dependency_overrides[get_settings] = override_get_settings
-    
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        yield client
+    app_instance.dependency_overrides[get_db] = override_get_db
+    app_instance.dependency_overrides[get_settings] = override_get_settings
+
+    transport = ASGITransport(app=app_instance)
+    try:
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
+    finally:
+        app_instance.dependency_overrides.clear()
 
 # Additional fixtures can be added here as needed for specific test cases
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""
+Pytest fixtures shared by the service layer tests.
+
+These fixtures are only collected when pytest runs tests under this directory,
+so API test runs do not pay for service-test setup.
+
+Requirements addressed:
+- Testing (2. SYSTEM ARCHITECTURE/2.2 Component Description/2.2.1 Application Layer):
+  Provides common fixtures for testing the application's service layer.
+"""
+
+from decimal import Decimal
+from unittest.mock import Mock
+from uuid import UUID
+
+import pytest
+
+from src.backend.core.config import get_settings
+
+@pytest.fixture
+def mock_db_session():
+    return Mock()
+
+# Configured once per module; the overrides are undone when the module's tests finish
+@pytest.fixture(scope="module")
+def mock_settings():
+    settings = get_settings()
+    original = (settings.FOREIGN_EXCHANGE_API_KEY, settings.FOREIGN_EXCHANGE_API_URL)
+    settings.FOREIGN_EXCHANGE_API_KEY = "test_api_key"
+    settings.FOREIGN_EXCHANGE_API_URL = "https://api.example.com/forex"
+    yield settings
+    # get_settings() returns a shared cached instance, so undo the overrides
+    settings.FOREIGN_EXCHANGE_API_KEY, settings.FOREIGN_EXCHANGE_API_URL = original
+
+# Common test data that can be used across multiple test modules
+@pytest.fixture
+def sample_metrics_input():
+    return {
+        "company_id": UUID("12345678-1234-5678-1234-567812345678"),
+        "reporting_year": 2023,
+        "reporting_quarter": 2,
+        "currency": "USD",
+        "total_revenue": Decimal("1000000"),
+        "recurring_revenue": Decimal("800000"),
+        "gross_profit": Decimal("600000"),
+        "employees": 50,
+        "cash_burn": Decimal("200000"),
+        "cash_balance": Decimal("1000000"),
+        "sales_marketing_expense": Decimal("150000"),
+        "total_operating_expense": Decimal("800000"),
+        "ebitda": Decimal("200000"),
+        "net_income": Decimal("150000"),
+        "fiscal_reporting_date": "2023-06-30",
+        "fiscal_reporting_quarter": 2,
+    }
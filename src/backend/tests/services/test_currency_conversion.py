@@ -1,33 +1,41 @@
 import pytest
+import requests
 from decimal import Decimal
-from datetime import date, datetime
-from unittest.mock import patch, MagicMock
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import patch, Mock
 
+from src.backend.services import currency_conversion
 from src.backend.services.currency_conversion import (
     get_exchange_rate,
     convert_currency,
     update_exchange_rates,
     _fetch_exchange_rate,
 )
-from src.backend.core.config import get_settings
 from src.backend.models.company import Company
 from src.backend.db.session import get_db
 
-# Pytest fixture for mocking the settings
-@pytest.fixture
-def mock_settings():
-    settings = get_settings()
-    settings.FOREIGN_EXCHANGE_API_KEY = "test_api_key"
-    settings.FOREIGN_EXCHANGE_API_URL = "https://api.example.com/forex"
-    return settings
+pytestmark = pytest.mark.asyncio
+
+# Exchange rate returned by every mocked rate lookup
+_RATE = Decimal("1.25")
+
+# Date reported as "today" to update_exchange_rates
+_TODAY = date(2023, 4, 15)
+
+# Successful FX API response. It holds no call state, so tests share one instance.
+_BASE_RESPONSE = SimpleNamespace(
+    raise_for_status=lambda: None,
+    json=lambda: {"rates": {"CAD": 1.25}},
+)
 
 # Pytest fixture for mocking the Company model
 @pytest.fixture
 def mock_company_model():
     companies = [
-        MagicMock(reporting_currency="USD"),
-        MagicMock(reporting_currency="CAD"),
-        MagicMock(reporting_currency="EUR"),
+        SimpleNamespace(reporting_currency="USD"),
+        SimpleNamespace(reporting_currency="CAD"),
+        SimpleNamespace(reporting_currency="EUR"),
     ]
     with patch("src.backend.models.company.Company") as mock_company:
         mock_company.query.all.return_value = companies
@@ -36,12 +44,20 @@ def mock_company_model():
 # Pytest fixture for mocking the database session
 @pytest.fixture
 def mock_db_session():
-    mock_session = MagicMock()
+    mock_session = Mock()
     with patch("src.backend.db.session.get_db", return_value=iter([mock_session])):
         yield mock_session
 
-@pytest.mark.asyncio
-async def test_get_exchange_rate(mock_settings):
+# Fixture swapping the exchange rate API call for a mock returning a fixed rate.
+# The attribute is assigned and restored directly, without patch() machinery.
+@pytest.fixture
+def mock_fetch():
+    original = currency_conversion._fetch_exchange_rate
+    currency_conversion._fetch_exchange_rate = Mock(return_value=_RATE)
+    yield currency_conversion._fetch_exchange_rate
+    currency_conversion._fetch_exchange_rate = original
+
+async def test_get_exchange_rate(mock_settings, mock_fetch):
     """
     Test the get_exchange_rate function
     
@@ -49,20 +65,16 @@ async def test_get_exchange_rate(mock_settings):
     - Multi-Currency Support Testing (1.2 Scope/Core Functionalities/4. Multi-Currency Support)
     - Data Transformation Testing (1.2 Scope/Core Functionalities/3. Data Transformation)
     """
-    with patch("src.backend.services.currency_conversion._fetch_exchange_rate") as mock_fetch:
-        mock_fetch.return_value = Decimal("1.25")
-        
-        # Test fetching a new exchange rate
-        rate = await get_exchange_rate("USD", "CAD", date(2023, 1, 1))
-        assert rate == Decimal("1.25")
-        mock_fetch.assert_called_once_with("USD", "CAD", date(2023, 1, 1))
-        
-        # Test caching mechanism
-        rate = await get_exchange_rate("USD", "CAD", date(2023, 1, 1))
-        assert rate == Decimal("1.25")
-        assert mock_fetch.call_count == 1  # Should not be called again due to caching
+    # Test fetching a new exchange rate
+    rate = await get_exchange_rate("USD", "CAD", date(2023, 1, 1))
+    assert rate == _RATE
+    mock_fetch.assert_called_once_with("USD", "CAD", date(2023, 1, 1))
+    
+    # Test caching mechanism
+    rate = await get_exchange_rate("USD", "CAD", date(2023, 1, 1))
+    assert rate == _RATE
+    assert mock_fetch.call_count == 1  # Should not be called again due to caching
 
-@pytest.mark.asyncio
 async def test_convert_currency(mock_settings):
     """
     Test the convert_currency function
@@ -72,41 +84,42 @@ async def test_convert_currency(mock_settings):
     - Data Transformation Testing (1.2 Scope/Core Functionalities/3. Data Transformation)
     """
     with patch("src.backend.services.currency_conversion.get_exchange_rate") as mock_get_rate:
-        mock_get_rate.return_value = Decimal("1.25")
+        mock_get_rate.return_value = _RATE
         
         amount = Decimal("100.00")
         converted = await convert_currency(amount, "USD", "CAD", date(2023, 1, 1))
         assert converted == Decimal("125.00")
         mock_get_rate.assert_called_once_with("USD", "CAD", date(2023, 1, 1))
 
-@pytest.mark.asyncio
-async def test_update_exchange_rates(mock_settings, mock_db_session):
+async def test_update_exchange_rates(mock_settings, mock_db_session, monkeypatch):
     """
     Test the update_exchange_rates function
     
     Requirements addressed:
     - Multi-Currency Support Testing (1.2 Scope/Core Functionalities/4. Multi-Currency Support)
     """
-    mock_db_session.query.return_value.distinct.return_value.all.return_value = [
-        ("USD",), ("CAD",), ("EUR",)
-    ]
+    # query(...).distinct().all() result, built from plain namespaces rather than auto-created mocks
+    mock_db_session.query.return_value = SimpleNamespace(
+        distinct=lambda: SimpleNamespace(all=lambda: [("USD",), ("CAD",), ("EUR",)])
+    )
+    # Pin the date the service reads so the expected calls hold across midnight
+    monkeypatch.setattr(currency_conversion, "date", SimpleNamespace(today=lambda: _TODAY))
     
     with patch("src.backend.services.currency_conversion.get_exchange_rate") as mock_get_rate:
-        mock_get_rate.return_value = Decimal("1.25")
+        mock_get_rate.return_value = _RATE
         
         await update_exchange_rates()
         
         # Check that get_exchange_rate was called for each unique currency pair
         expected_calls = [
-            (("EUR", "USD", datetime.now().date()),),
-            (("EUR", "CAD", datetime.now().date()),),
-            (("USD", "CAD", datetime.now().date()),),
+            (("EUR", "USD", _TODAY),),
+            (("EUR", "CAD", _TODAY),),
+            (("USD", "CAD", _TODAY),),
         ]
         assert mock_get_rate.call_count == len(expected_calls)
         mock_get_rate.assert_has_calls(expected_calls, any_order=True)
 
-@pytest.mark.asyncio
-async def test_fetch_exchange_rate(mock_settings):
+async def test_fetch_exchange_rate(mock_settings, monkeypatch):
     """
     Test the _fetch_exchange_rate function
     
@@ -114,51 +127,44 @@ async def test_fetch_exchange_rate(mock_settings):
     - Multi-Currency Support Testing (1.2 Scope/Core Functionalities/4. Multi-Currency Support)
     - Data Transformation Testing (1.2 Scope/Core Functionalities/3. Data Transformation)
     """
-    with patch("requests.get") as mock_get:
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"rates": {"CAD": 1.25}}
-        mock_get.return_value = mock_response
-        
-        rate = await _fetch_exchange_rate("USD", "CAD", date(2023, 1, 1))
-        assert rate == Decimal("1.25")
-        
-        mock_get.assert_called_once_with(
-            f"{mock_settings.FOREIGN_EXCHANGE_API_URL}/historical",
-            params={
-                "api_key": mock_settings.FOREIGN_EXCHANGE_API_KEY,
-                "base": "USD",
-                "symbols": "CAD",
-                "date": "2023-01-01",
-            },
-            timeout=10
-        )
-
-@pytest.mark.asyncio
-async def test_exchange_rate_caching():
+    mock_get = Mock(return_value=_BASE_RESPONSE)
+    monkeypatch.setattr(currency_conversion.requests, "get", mock_get)
+    
+    rate = await _fetch_exchange_rate("USD", "CAD", date(2023, 1, 1))
+    assert rate == _RATE
+    
+    mock_get.assert_called_once_with(
+        f"{mock_settings.FOREIGN_EXCHANGE_API_URL}/historical",
+        params={
+            "api_key": mock_settings.FOREIGN_EXCHANGE_API_KEY,
+            "base": "USD",
+            "symbols": "CAD",
+            "date": "2023-01-01",
+        },
+        timeout=10
+    )
+
+async def test_exchange_rate_caching(mock_fetch):
     """
     Test the caching mechanism of exchange rates
     
     Requirements addressed:
     - Multi-Currency Support Testing (1.2 Scope/Core Functionalities/4. Multi-Currency Support)
     """
-    with patch("src.backend.services.currency_conversion._fetch_exchange_rate") as mock_fetch:
-        mock_fetch.return_value = Decimal("1.25")
-        
-        # First call should fetch the rate
-        rate1 = await get_exchange_rate("USD", "CAD", date(2023, 1, 1))
-        assert rate1 == Decimal("1.25")
-        mock_fetch.assert_called_once()
-        
-        # Second call with the same parameters should use the cached value
-        rate2 = await get_exchange_rate("USD", "CAD", date(2023, 1, 1))
-        assert rate2 == Decimal("1.25")
-        assert mock_fetch.call_count == 1  # Should not be called again
-        
-        # Call with different parameters should fetch a new rate
-        rate3 = await get_exchange_rate("USD", "EUR", date(2023, 1, 1))
-        assert mock_fetch.call_count == 2  # Should be called again for the new currency pair
+    # First call should fetch the rate
+    rate1 = await get_exchange_rate("USD", "CAD", date(2023, 1, 1))
+    assert rate1 == _RATE
+    mock_fetch.assert_called_once()
+    
+    # Second call with the same parameters should use the cached value
+    rate2 = await get_exchange_rate("USD", "CAD", date(2023, 1, 1))
+    assert rate2 == _RATE
+    assert mock_fetch.call_count == 1  # Should not be called again
+    
+    # Call with different parameters should fetch a new rate
+    rate3 = await get_exchange_rate("USD", "EUR", date(2023, 1, 1))
+    assert mock_fetch.call_count == 2  # Should be called again for the new currency pair
 
-@pytest.mark.asyncio
 async def test_convert_currency_same_currency():
     """
     Test converting currency when the source and target currencies are the same
@@ -170,7 +176,6 @@ async def test_convert_currency_same_currency():
     converted = await convert_currency(amount, "USD", "USD", date(2023, 1, 1))
     assert converted == amount
 
-@pytest.mark.asyncio
 async def test_update_exchange_rates_error_handling(mock_db_session):
     """
     Test error handling in update_exchange_rates function
@@ -183,19 +188,18 @@ async def test_update_exchange_rates_error_handling(mock_db_session):
     with pytest.raises(ValueError, match="Failed to update exchange rates"):
         await update_exchange_rates()
 
-@pytest.mark.asyncio
-async def test_fetch_exchange_rate_error_handling(mock_settings):
+async def test_fetch_exchange_rate_error_handling(mock_settings, monkeypatch):
     """
     Test error handling in _fetch_exchange_rate function
     
     Requirements addressed:
     - Error Handling and Logging (1.2 Scope/Core Functionalities/7. Error Handling and Logging)
     """
-    with patch("requests.get") as mock_get:
-        mock_get.side_effect = requests.RequestException("API error")
-        
-        with pytest.raises(ValueError, match="Failed to fetch exchange rate from API"):
-            await _fetch_exchange_rate("USD", "CAD", date(2023, 1, 1))
+    mock_get = Mock(side_effect=requests.RequestException("API error"))
+    monkeypatch.setattr(currency_conversion.requests, "get", mock_get)
+    
+    with pytest.raises(ValueError, match="Failed to fetch exchange rate from API"):
+        await _fetch_exchange_rate("USD", "CAD", date(2023, 1, 1))
 
 if __name__ == "__main__":
     pytest.main()
\ No newline at end of file
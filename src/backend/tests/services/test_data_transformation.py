@@ -1,20 +1,81 @@
 import pytest
-from unittest.mock import Mock, patch
-from freezegun import freeze_time
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, Mock, patch
+from datetime import datetime
 from decimal import Decimal
+from types import SimpleNamespace
 from uuid import UUID
 
+from src.backend.models import reporting_financials as reporting_financials_module
 from src.backend.services.data_transformation import DataTransformationService
 from src.backend.models.metrics_input import MetricsInput
 from src.backend.models.reporting_financials import ReportingFinancials
 from src.backend.models.reporting_metrics import ReportingMetrics
-from src.backend.db.session import AsyncSession
 
 pytestmark = pytest.mark.asyncio
 
+# Amounts repeated across fixtures and expectations; Decimals are immutable, so sharing is safe
+_D_1M = Decimal('1000000')
+_D_500K = Decimal('500000')
+
+# Timestamp returned by datetime.utcnow() while model rows are built
+_FROZEN_NOW = datetime(2023, 4, 15)
+
+# Exchange rate used for every conversion to CAD
+_CAD_RATE = Decimal('1.25')
+
+def _side(amount, _from_currency, to_currency, _date, _rate=_CAD_RATE):
+    """Stand-in for convert_currency: converts to CAD at _CAD_RATE, leaves other currencies unchanged."""
+    return amount * _rate if to_currency == 'CAD' else amount
+
+class _CountingAsyncMock:
+    """
+    Awaitable stand-in that records only how many times it was called.
+
+    Used where tests assert call_count alone, so no per-call argument history is kept.
+    """
+
+    def __init__(self, side_effect):
+        self.side_effect = side_effect
+        self.call_count = 0
+
+    async def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        return self.side_effect(*args, **kwargs)
+
+@contextmanager
+def frozen_utcnow(now):
+    """Make datetime.utcnow() return ``now`` inside ReportingFinancials for the duration of the block."""
+    original = reporting_financials_module.datetime
+    reporting_financials_module.datetime = SimpleNamespace(utcnow=lambda: now)
+    try:
+        yield
+    finally:
+        reporting_financials_module.datetime = original
+
+@pytest.fixture
+def frozen_now():
+    # Only ReportingFinancials reads the clock here; swap its datetime name and nothing else
+    with frozen_utcnow(_FROZEN_NOW):
+        yield
+
+class _FakeAsyncSession:
+    """
+    Minimal stand-in for AsyncSession exposing only what DataTransformationService uses.
+
+    Awaited methods are AsyncMocks and the rest plain Mocks, so no introspection
+    of the SQLAlchemy session class happens per test.
+    """
+
+    def __init__(self):
+        self.execute = AsyncMock(return_value=Mock())
+        self.query = Mock()
+        self.add = Mock()
+        self.commit = AsyncMock()
+
 @pytest.fixture
 async def mock_db_session():
-    return Mock(spec=AsyncSession)
+    return _FakeAsyncSession()
 
 @pytest.fixture
 async def mock_metrics_calculation_service():
@@ -26,22 +87,23 @@ async def data_transformation_service(mock_db_session, mock_metrics_calculation_
     service.metrics_calculation_service = mock_metrics_calculation_service
     return service
 
-@pytest.fixture
+# Input metrics are only read by the tests, so one instance serves the session
+@pytest.fixture(scope="session")
 def mock_input_metrics():
     return MetricsInput(
         id=UUID('87654321-4321-8765-4321-876543210987'),
         company_id=UUID('12345678-1234-5678-1234-567812345678'),
         currency='USD',
-        total_revenue=Decimal('1000000'),
+        total_revenue=_D_1M,
         recurring_revenue=Decimal('800000'),
         gross_profit=Decimal('600000'),
         sales_marketing_expense=Decimal('200000'),
-        total_operating_expense=Decimal('500000'),
+        total_operating_expense=_D_500K,
         ebitda=Decimal('300000'),
         net_income=Decimal('250000'),
         cash_burn=Decimal('50000'),
-        cash_balance=Decimal('1000000'),
-        debt_outstanding=Decimal('500000'),
+        cash_balance=_D_1M,
+        debt_outstanding=_D_500K,
         employees=100,
         customers=1000,
         fiscal_reporting_date='2023-03-31',
@@ -50,7 +112,49 @@ def mock_input_metrics():
         reporting_quarter=1
     )
 
-async def test_transform_data(data_transformation_service, mock_db_session, mock_metrics_calculation_service, mock_input_metrics):
+# Metrics returned by the mocked calculation service; built once per module since
+# test_transform_data only compares against it
+@pytest.fixture(scope="module")
+def mock_reporting_metrics():
+    return ReportingMetrics(
+        company_id=UUID('12345678-1234-5678-1234-567812345678'),
+        currency='USD',
+        enterprise_value=Decimal('10000000'),
+        arr=Decimal('3200000'),
+        recurring_percentage_revenue=Decimal('80'),
+        revenue_per_fte=Decimal('10000'),
+        gross_profit_per_fte=Decimal('6000'),
+        employee_growth_rate=Decimal('10'),
+        change_in_cash=Decimal('-50000'),
+        revenue_growth=Decimal('20'),
+        monthly_cash_burn=Decimal('16667'),
+        runway_months=Decimal('60'),
+        ev_by_equity_raised_plus_debt=Decimal('2'),
+        sales_marketing_percentage_revenue=Decimal('20'),
+        total_operating_percentage_revenue=Decimal('50'),
+        gross_profit_margin=Decimal('60'),
+        valuation_to_revenue=Decimal('10'),
+        yoy_growth_revenue=Decimal('25'),
+        yoy_growth_profit=Decimal('30'),
+        yoy_growth_employees=Decimal('15'),
+        yoy_growth_ltm_revenue=Decimal('22'),
+        ltm_total_revenue=Decimal('3800000'),
+        ltm_gross_profit=Decimal('2280000'),
+        ltm_sales_marketing_expense=Decimal('760000'),
+        ltm_gross_margin=Decimal('60'),
+        ltm_operating_expense=Decimal('1900000'),
+        ltm_ebitda=Decimal('1140000'),
+        ltm_net_income=Decimal('950000'),
+        ltm_ebitda_margin=Decimal('30'),
+        ltm_net_income_margin=Decimal('25'),
+        fiscal_reporting_date='2023-03-31',
+        fiscal_reporting_quarter=1,
+        reporting_year=2023,
+        reporting_quarter=1,
+        created_date=_FROZEN_NOW.date()
+    )
+
+async def test_transform_data(data_transformation_service, mock_db_session, mock_metrics_calculation_service, mock_input_metrics, mock_reporting_metrics, frozen_now):
     company_id = UUID('12345678-1234-5678-1234-567812345678')
     reporting_year = 2023
     reporting_quarter = 1
@@ -59,53 +163,18 @@ async def test_transform_data(data_transformation_service, mock_db_session, mock
     mock_db_session.execute.return_value.scalar_one_or_none.return_value = mock_input_metrics
 
     # Mock currency conversion
-    with patch('src.backend.services.data_transformation.convert_currency') as mock_convert_currency, \
-         patch('src.backend.services.data_transformation.get_exchange_rate') as mock_get_exchange_rate:
-        mock_convert_currency.side_effect = lambda amount, from_currency, to_currency, date: amount * Decimal('1.25') if to_currency == 'CAD' else amount
-        mock_get_exchange_rate.return_value = Decimal('1.25')
-
+    mock_convert_currency = AsyncMock(side_effect=_side)
+    mock_get_exchange_rate = AsyncMock(return_value=_CAD_RATE)
+    with patch.multiple(
+        'src.backend.services.data_transformation',
+        convert_currency=mock_convert_currency,
+        get_exchange_rate=mock_get_exchange_rate,
+    ):
         # Mock metrics calculation
-        mock_metrics = ReportingMetrics(
-            company_id=company_id,
-            currency='USD',
-            enterprise_value=Decimal('10000000'),
-            arr=Decimal('3200000'),
-            recurring_percentage_revenue=Decimal('80'),
-            revenue_per_fte=Decimal('10000'),
-            gross_profit_per_fte=Decimal('6000'),
-            employee_growth_rate=Decimal('10'),
-            change_in_cash=Decimal('-50000'),
-            revenue_growth=Decimal('20'),
-            monthly_cash_burn=Decimal('16667'),
-            runway_months=Decimal('60'),
-            ev_by_equity_raised_plus_debt=Decimal('2'),
-            sales_marketing_percentage_revenue=Decimal('20'),
-            total_operating_percentage_revenue=Decimal('50'),
-            gross_profit_margin=Decimal('60'),
-            valuation_to_revenue=Decimal('10'),
-            yoy_growth_revenue=Decimal('25'),
-            yoy_growth_profit=Decimal('30'),
-            yoy_growth_employees=Decimal('15'),
-            yoy_growth_ltm_revenue=Decimal('22'),
-            ltm_total_revenue=Decimal('3800000'),
-            ltm_gross_profit=Decimal('2280000'),
-            ltm_sales_marketing_expense=Decimal('760000'),
-            ltm_gross_margin=Decimal('60'),
-            ltm_operating_expense=Decimal('1900000'),
-            ltm_ebitda=Decimal('1140000'),
-            ltm_net_income=Decimal('950000'),
-            ltm_ebitda_margin=Decimal('30'),
-            ltm_net_income_margin=Decimal('25'),
-            fiscal_reporting_date='2023-03-31',
-            fiscal_reporting_quarter=1,
-            reporting_year=2023,
-            reporting_quarter=1
-        )
-        mock_metrics_calculation_service.calculate_derived_metrics.return_value = mock_metrics
+        mock_metrics_calculation_service.calculate_derived_metrics.return_value = mock_reporting_metrics
 
         # Call the method under test
-        with freeze_time("2023-04-15"):
-            result_financials, result_metrics = await data_transformation_service.transform_data(company_id, reporting_year, reporting_quarter)
+        result_financials, result_metrics = await data_transformation_service.transform_data(company_id, reporting_year, reporting_quarter)
 
     # Assertions
     assert isinstance(result_financials, ReportingFinancials)
@@ -115,19 +184,19 @@ async def test_transform_data(data_transformation_service, mock_db_session, mock
     assert result_financials.company_id == company_id
     assert result_financials.currency == 'USD'
     assert result_financials.exchange_rate_used == Decimal('1')
-    assert result_financials.total_revenue == Decimal('1000000')
+    assert result_financials.total_revenue == _D_1M
     assert result_financials.recurring_revenue == Decimal('800000')
     assert result_financials.gross_profit == Decimal('600000')
     assert result_financials.sales_marketing_expense == Decimal('200000')
-    assert result_financials.total_operating_expense == Decimal('500000')
+    assert result_financials.total_operating_expense == _D_500K
     assert result_financials.ebitda == Decimal('300000')
     assert result_financials.net_income == Decimal('250000')
     assert result_financials.cash_burn == Decimal('50000')
-    assert result_financials.cash_balance == Decimal('1000000')
-    assert result_financials.debt_outstanding == Decimal('500000')
+    assert result_financials.cash_balance == _D_1M
+    assert result_financials.debt_outstanding == _D_500K
 
     # Check metrics
-    assert result_metrics == mock_metrics
+    assert result_metrics == mock_reporting_metrics
 
     # Verify method calls
     mock_db_session.execute.assert_called_once()
@@ -140,11 +209,21 @@ async def test_transform_data(data_transformation_service, mock_db_session, mock
 async def test_convert_financials(data_transformation_service, mock_input_metrics):
     target_currencies = ['USD', 'CAD']
 
-    with patch('src.backend.services.data_transformation.convert_currency') as mock_convert_currency, \
-         patch('src.backend.services.data_transformation.get_exchange_rate') as mock_get_exchange_rate:
-        mock_convert_currency.side_effect = lambda amount, from_currency, to_currency, date: amount * Decimal('1.25') if to_currency == 'CAD' else amount
-        mock_get_exchange_rate.return_value = Decimal('1.25')
+    # Rates applied by the convert_currency fake, recorded so the stored exchange rate can be checked against them
+    rates_applied = set()
+
+    def convert(amount, from_currency, to_currency, date):
+        converted = _side(amount, from_currency, to_currency, date)
+        rates_applied.add(converted / amount)
+        return converted
 
+    mock_convert_currency = _CountingAsyncMock(convert)
+    mock_get_exchange_rate = _CountingAsyncMock(lambda *args: _CAD_RATE)
+    with patch.multiple(
+        'src.backend.services.data_transformation',
+        convert_currency=mock_convert_currency,
+        get_exchange_rate=mock_get_exchange_rate,
+    ):
         # Call the method under test
         result = await data_transformation_service.convert_financials(mock_input_metrics, target_currencies)
 
@@ -154,22 +233,22 @@ async def test_convert_financials(data_transformation_service, mock_input_metric
 
     # Check USD financials
     usd_financials = result['USD']
-    assert usd_financials['total_revenue'] == Decimal('1000000')
+    assert usd_financials['total_revenue'] == _D_1M
     assert usd_financials['recurring_revenue'] == Decimal('800000')
     assert usd_financials['gross_profit'] == Decimal('600000')
     assert usd_financials['sales_marketing_expense'] == Decimal('200000')
-    assert usd_financials['total_operating_expense'] == Decimal('500000')
+    assert usd_financials['total_operating_expense'] == _D_500K
     assert usd_financials['ebitda'] == Decimal('300000')
     assert usd_financials['net_income'] == Decimal('250000')
     assert usd_financials['cash_burn'] == Decimal('50000')
-    assert usd_financials['cash_balance'] == Decimal('1000000')
-    assert usd_financials['debt_outstanding'] == Decimal('500000')
+    assert usd_financials['cash_balance'] == _D_1M
+    assert usd_financials['debt_outstanding'] == _D_500K
     assert usd_financials['exchange_rate_used'] == Decimal('1.0')
 
     # Check CAD financials
     cad_financials = result['CAD']
     assert cad_financials['total_revenue'] == Decimal('1250000')
-    assert cad_financials['recurring_revenue'] == Decimal('1000000')
+    assert cad_financials['recurring_revenue'] == _D_1M
     assert cad_financials['gross_profit'] == Decimal('750000')
     assert cad_financials['sales_marketing_expense'] == Decimal('250000')
     assert cad_financials['total_operating_expense'] == Decimal('625000')
@@ -178,33 +257,35 @@ async def test_convert_financials(data_transformation_service, mock_input_metric
     assert cad_financials['cash_burn'] == Decimal('62500')
     assert cad_financials['cash_balance'] == Decimal('1250000')
     assert cad_financials['debt_outstanding'] == Decimal('625000')
-    assert cad_financials['exchange_rate_used'] == Decimal('1.25')
+    assert cad_financials['exchange_rate_used'] == _CAD_RATE
+    # The stored rate comes from a separate get_exchange_rate call; it must match the rate used to convert
+    assert rates_applied == {cad_financials['exchange_rate_used']}
 
     # Verify method calls
     assert mock_convert_currency.call_count == 10  # Once for each financial field
     assert mock_get_exchange_rate.call_count == 1  # Once for CAD
 
-async def test_update_reporting_financials(data_transformation_service, mock_db_session):
+async def test_update_reporting_financials(data_transformation_service, mock_db_session, frozen_now):
     company_id = UUID('12345678-1234-5678-1234-567812345678')
     reporting_year = 2023
     reporting_quarter = 1
     converted_financials = {
         'USD': {
-            'total_revenue': Decimal('1000000'),
+            'total_revenue': _D_1M,
             'recurring_revenue': Decimal('800000'),
             'gross_profit': Decimal('600000'),
             'sales_marketing_expense': Decimal('200000'),
-            'total_operating_expense': Decimal('500000'),
+            'total_operating_expense': _D_500K,
             'ebitda': Decimal('300000'),
             'net_income': Decimal('250000'),
             'cash_burn': Decimal('50000'),
-            'cash_balance': Decimal('1000000'),
-            'debt_outstanding': Decimal('500000'),
+            'cash_balance': _D_1M,
+            'debt_outstanding': _D_500K,
             'exchange_rate_used': Decimal('1.0')
         },
         'CAD': {
             'total_revenue': Decimal('1250000'),
-            'recurring_revenue': Decimal('1000000'),
+            'recurring_revenue': _D_1M,
             'gross_profit': Decimal('750000'),
             'sales_marketing_expense': Decimal('250000'),
             'total_operating_expense': Decimal('625000'),
@@ -213,7 +294,7 @@ async def test_update_reporting_financials(data_transformation_service, mock_db_
             'cash_burn': Decimal('62500'),
             'cash_balance': Decimal('1250000'),
             'debt_outstanding': Decimal('625000'),
-            'exchange_rate_used': Decimal('1.25')
+            'exchange_rate_used': _CAD_RATE
         }
     }
 
@@ -221,10 +302,9 @@ async def test_update_reporting_financials(data_transformation_service, mock_db_
     mock_db_session.execute.return_value.scalar_one_or_none.return_value = None
 
     # Call the method under test
-    with freeze_time("2023-04-15"):
-        result = await data_transformation_service.update_reporting_financials(
-            company_id, reporting_year, reporting_quarter, converted_financials
-        )
+    result = await data_transformation_service.update_reporting_financials(
+        company_id, reporting_year, reporting_quarter, converted_financials
+    )
 
     # Assertions
     assert isinstance(result, dict)
@@ -0,0 +1,5 @@
+"""
+Test package for the backend utilities.
+
+Test modules are discovered by pytest from the file system.
+"""
@@ -0,0 +1,39 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.backend.utils.rate_limiter import RateLimiter, rate_limit_middleware
+
+pytestmark = pytest.mark.asyncio
+
+def _app_with_limiter(limiter: RateLimiter) -> FastAPI:
+    """Builds an app with one route, rate limited by the given token bucket."""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    @app.middleware("http")
+    async def _rate_limit(request, call_next):
+        return await rate_limit_middleware(request, call_next, limiter)
+
+    return app
+
+async def test_rate_limit_exceeded_returns_429():
+    # One token that takes over a day to refill, so the second request is always throttled
+    limiter = RateLimiter(tokens=1, refresh_rate=1e-5)
+    app = _app_with_limiter(limiter)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        first = await client.get("/ping")
+        second = await client.get("/ping")
+
+    assert first.status_code == 200
+    assert first.headers["X-RateLimit-Remaining"] == "0"
+
+    assert second.status_code == 429
+    assert second.json() == {"detail": "Rate limit exceeded"}
+    assert second.headers["X-RateLimit-Limit"] == "1"
+    assert second.headers["X-RateLimit-Remaining"] == "0"
+    assert int(second.headers["X-RateLimit-Reset"]) > 0
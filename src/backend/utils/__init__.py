@@ -12,32 +12,55 @@ Requirements addressed:
 - API Security (6. SECURITY CONSIDERATIONS/6.3 SECURITY PROTOCOLS/6.3.6 API Security)
 """
 
-from typing import Any, Dict, Optional
-
-# Import logging utility functions
-from src.backend.utils.logging import (
-    setup_logging,
-    get_logger,
-    log_api_call,
-    log_database_query,
-    log_error
-)
-
-# Import rate limiting utility functions and class
-from src.backend.utils.rate_limiter import (
-    RateLimiter,
-    create_rate_limiter,
-    rate_limit_middleware,
-    add_rate_limiting
-)
-
-# Import error handling utility functions
-from src.backend.utils.error_handlers import (
-    http_error_handler,
-    validation_error_handler,
-    format_error_response,
-    setup_error_handlers
-)
+import importlib
+from typing import Any, Dict
+
+# Exported names and the module defining each. The modules pull in fastapi,
+# pythonjsonlogger and the Azure Monitor SDK, so they are only imported when
+# one of their names is first accessed (PEP 562).
+_LAZY_EXPORTS: Dict[str, str] = {
+    # Logging utility functions
+    'setup_logging': 'src.backend.utils.logging',
+    'get_logger': 'src.backend.utils.logging',
+    'log_api_call': 'src.backend.utils.logging',
+    'log_database_query': 'src.backend.utils.logging',
+    'log_error': 'src.backend.utils.logging',
+    'stop_logging': 'src.backend.utils.logging',
+    # Rate limiting utility functions and class
+    'RateLimiter': 'src.backend.utils.rate_limiter',
+    'create_rate_limiter': 'src.backend.utils.rate_limiter',
+    'rate_limit_middleware': 'src.backend.utils.rate_limiter',
+    'add_rate_limiting': 'src.backend.utils.rate_limiter',
+    # Error handling utility functions
+    'http_error_handler': 'src.backend.utils.error_handlers',
+    'validation_error_handler': 'src.backend.utils.error_handlers',
+    'format_error_response': 'src.backend.utils.error_handlers',
+    'setup_error_handlers': 'src.backend.utils.error_handlers',
+}
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports an exported name from its defining module on first access and caches it.
+
+    Args:
+        name (str): The attribute being looked up on the package.
+
+    Returns:
+        Any: The exported function or class.
+
+    Raises:
+        AttributeError: If the name is not exported by the package.
+    """
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 # Export all imported functions and classes
 __all__ = [
@@ -46,6 +69,7 @@ __all__ = [
     'log_api_call',
     'log_database_query',
     'log_error',
+    'stop_logging',
     'RateLimiter',
     'create_rate_limiter',
     'rate_limit_middleware',
@@ -78,6 +102,11 @@ def initialize_utils(app: FastAPI, log_level: str = "INFO") -> None:
     Returns:
         None
     """
+    # Module-level __getattr__ is not consulted for global lookups inside functions
+    from src.backend.utils.logging import setup_logging, get_logger
+    from src.backend.utils.rate_limiter import add_rate_limiting
+    from src.backend.utils.error_handlers import setup_error_handlers
+
     # Set up logging
     setup_logging(log_level)
 
@@ -90,39 +119,3 @@ def initialize_utils(app: FastAPI, log_level: str = "INFO") -> None:
     # Log initialization
     logger = get_logger(__name__)
     logger.info("Utility functions initialized successfully.")
-
-# Additional package initialization code can be added here if needed
-```
-
-This regenerated implementation includes several improvements and ensures that the code is enterprise-grade and production-ready:
-
-1. Added a comprehensive module docstring explaining the purpose of the module and the requirements it addresses.
-
-2. Imported all necessary functions and classes from the utility modules.
-
-3. Updated the `__all__` list to include all exported functions and classes.
-
-4. Added type aliases for improved readability and maintainability.
-
-5. Created an `initialize_utils` function to centralize the initialization of utility functions for the application.
-
-6. Updated the version number to reflect the changes made.
-
-7. Ensured that all imports are correct and used properly based on the implementations of the imported files.
-
-8. Added type hints where applicable to improve code quality and maintainability.
-
-This implementation provides a centralized access point for all utility functions and classes used throughout the backend application. It also includes an initialization function that can be called from the main application file to set up logging, rate limiting, and error handlers.
-
-To use this utility package in your main FastAPI application, you would typically do the following:
-
-```python
-from fastapi import FastAPI
-from src.backend.utils import initialize_utils
-
-app = FastAPI()
-
-# Initialize utility functions
-initialize_utils(app, log_level="INFO")
-
-# Rest of your FastAPI application code
\ No newline at end of file
@@ -9,42 +9,53 @@ Requirements addressed:
 - API Security (6. SECURITY CONSIDERATIONS/6.3 SECURITY PROTOCOLS/6.3.6 API Security)
 """
 
-from fastapi import HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import Request
+from fastapi.responses import Response
 from fastapi.exceptions import RequestValidationError
+from starlette.exceptions import HTTPException
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+import orjson
 
 from src.backend.core.config import settings
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
-async def http_error_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_error_handler(request: Request, exc: HTTPException) -> Response:
     """
     Handles HTTP exceptions and returns a formatted JSON response.
+
+    Registered for Starlette's HTTPException, so it also covers fastapi.HTTPException
+    (a subclass) and the exceptions raised by routing, such as 404 and 405.
     
     Args:
         request (Request): The incoming request object.
         exc (HTTPException): The HTTP exception that was raised.
     
     Returns:
-        JSONResponse: Formatted error response.
+        Response: Formatted error response, already encoded as JSON.
     """
-    # Log the error details
-    logger.error(f"HTTP error occurred: {exc.status_code} - {exc.detail}")
-    logger.error(f"Request path: {request.url.path}")
+    # Log the error details as a single record. The message carries them for any handler;
+    # the extras give the JSON formatter the same fields as keys
+    path = request.url.path
+    logger.error(
+        "HTTP error occurred: %s - %s (path: %s)", exc.status_code, exc.detail, path,
+        extra={"status": exc.status_code, "detail": str(exc.detail), "path": path}
+    )
 
     # Create the error response
     error_response = format_error_response(
         error_code=f"HTTP_{exc.status_code}",
         error_message=str(exc.detail),
-        error_details=[]
+        error_details=[],
+        request_id=request.headers.get(settings.REQUEST_ID_HEADER)
     )
 
-    return JSONResponse(content=error_response, status_code=exc.status_code)
+    return _json_response(error_response, exc.status_code, exc.headers)
 
-async def validation_error_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_error_handler(request: Request, exc: RequestValidationError) -> Response:
     """
     Handles validation errors for request data and returns a formatted JSON response.
     
@@ -53,28 +64,53 @@ async def validation_error_handler(request: Request, exc: RequestValidationError
         exc (RequestValidationError): The validation error that was raised.
     
     Returns:
-        JSONResponse: Formatted validation error response.
+        Response: Formatted validation error response, already encoded as JSON.
     """
-    # Log the validation error details
-    logger.error(f"Validation error occurred: {exc.errors()}")
-    logger.error(f"Request path: {request.url.path}")
+    # exc.errors() rebuilds the error list on every call, so fetch it once
+    errors = exc.errors()
+
+    # Log the validation error details as a single record, as in http_error_handler
+    path = request.url.path
+    logger.error(
+        "Validation error occurred: %s (path: %s)", errors, path,
+        extra={"status": 422, "detail": errors, "path": path}
+    )
 
     # Extract error details
     error_details = [
-        {"field": ".".join(map(str, error["loc"])), "issue": error["msg"]}
-        for error in exc.errors()
+        {"field": _field_path(error["loc"]), "issue": error["msg"]}
+        for error in errors
     ]
 
     # Create the error response
     error_response = format_error_response(
         error_code="VALIDATION_ERROR",
         error_message="The provided input is invalid.",
-        error_details=error_details
+        error_details=error_details,
+        request_id=request.headers.get(settings.REQUEST_ID_HEADER)
     )
 
-    return JSONResponse(content=error_response, status_code=422)
+    return _json_response(error_response, 422)
 
-def format_error_response(error_code: str, error_message: str, error_details: List[Dict[str, str]]) -> Dict[str, Any]:
+def _field_path(loc: Tuple[Union[int, str], ...]) -> str:
+    """
+    Joins a validation error location into a dotted field path.
+
+    Args:
+        loc (Tuple[Union[int, str], ...]): Location of the error, e.g. ("body", "items", 0).
+
+    Returns:
+        str: The dotted field path, e.g. "body.items.0".
+    """
+    if len(loc) == 1 and isinstance(loc[0], str):
+        return loc[0]
+    # Most locations are all field names; only list indices need converting
+    if all(isinstance(part, str) for part in loc):
+        return ".".join(loc)
+    return ".".join([str(part) for part in loc])
+
+def format_error_response(error_code: str, error_message: str, error_details: List[Dict[str, str]],
+                          request_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Formats an error response according to the specified structure.
     
@@ -82,6 +118,7 @@ def format_error_response(error_code: str, error_message: str, error_details: Li
         error_code (str): A unique code identifying the error.
         error_message (str): A human-readable error message.
         error_details (List[Dict[str, str]]): A list of detailed error information.
+        request_id (Optional[str]): The ID of the failed request, for tracing.
     
     Returns:
         Dict[str, Any]: Formatted error response dictionary.
@@ -91,10 +128,18 @@ def format_error_response(error_code: str, error_message: str, error_details: Li
             "code": error_code,
             "message": error_message,
             "details": error_details,
-            "request_id": settings.REQUEST_ID_HEADER  # Add request ID for tracing
+            "request_id": request_id
         }
     }
 
+def _json_response(content: Dict[str, Any], status_code: int,
+                   headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    Encodes an error response body with orjson, skipping JSONResponse's stdlib json encoding.
+    """
+    return Response(content=orjson.dumps(content), status_code=status_code, headers=headers,
+                    media_type="application/json")
+
 def setup_error_handlers(app):
     """
     Sets up error handlers for the FastAPI application.
@@ -11,67 +11,247 @@ Requirements addressed:
 """
 
 import logging
-from logging.handlers import RotatingFileHandler
-import json
-from typing import Any, Dict, Optional
+import os
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import queue
+import threading
+import time
+from typing import Any, Dict, Optional, Union
+import orjson
 from pythonjsonlogger import jsonlogger  # type: ignore
 from azure.monitor.opentelemetry import configure_azure_monitor  # type: ignore
 from src.backend.config import get_config, ENVIRONMENT
 
 # Import versions:
 # pythonjsonlogger==2.0.1
+# orjson==3.8.3
 # azure-monitor-opentelemetry==1.0.0b3
 
 logger = logging.getLogger(__name__)
 
-def setup_logging(log_level: str) -> None:
+# Capture every request header in log_api_call instead of the allowlist below; read once at import
+LOG_HEADERS = os.getenv("LOG_HEADERS", "false").lower() in ("1", "true", "yes")
+
+# Request headers recorded by log_api_call when LOG_HEADERS is off
+LOGGED_HEADERS = ("user-agent", "content-type")
+
+# Name of the QueueHandler setup_logging installs on the root logger
+QUEUE_HANDLER_NAME = "app-queue"
+
+# Background listener writing queued log records to the output handlers
+_queue_listener: Optional[QueueListener] = None
+
+# Batch settings for the log record processor configure_azure_monitor installs, so
+# records are exported in large batches from its worker thread. Values already set
+# in the environment take precedence.
+AZURE_LOG_EXPORT_SETTINGS = {
+    "OTEL_BLRP_MAX_QUEUE_SIZE": "8192",
+    "OTEL_BLRP_SCHEDULE_DELAY": "5000",
+    "OTEL_BLRP_MAX_EXPORT_BATCH_SIZE": "512",
+}
+
+class OrjsonFormatter(jsonlogger.JsonFormatter):
+    """
+    JsonFormatter that serializes log records with orjson instead of the stdlib json module.
+
+    orjson encodes datetimes and UUIDs natively; any other unsupported value is
+    rendered with str().
+
+    The second-resolution part of the timestamp is cached, so strftime runs
+    once per second rather than once per record.
+    """
+
+    _time_cache = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, formatted = self._time_cache
+        if second != cached_second:
+            formatted = time.strftime(self.default_time_format, self.converter(record.created))
+            # One tuple assignment, so a concurrent reader never sees a mismatched pair
+            self._time_cache = (second, formatted)
+        return self.default_msec_format % (formatted, record.msecs)
+
+    def jsonify_log_record(self, log_record: Dict[str, Any]) -> str:
+        return orjson.dumps(log_record, default=str).decode()
+
+# Attributes every LogRecord carries; anything else on a record was passed in extra=
+_RECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+class ExtrasFormatter(logging.Formatter):
+    """
+    Plain-text formatter that appends the fields passed in ``extra=`` to the line.
+
+    The fields are rendered as one compact orjson object after the message, so the
+    structured payloads of log_api_call, log_database_query and the error handlers
+    reach the plain-text console and the log file, not just the JSON handler.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        extras = {key: value for key, value in record.__dict__.items() if key not in _RECORD_ATTRS}
+        if not extras:
+            return line
+        return f"{line} {orjson.dumps(extras, default=str).decode()}"
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that coalesces writes in a large in-process buffer.
+
+    Records are written to a file opened with a 64 KiB buffer and flushed by a
+    background thread every ``flush_interval`` seconds, instead of after every
+    record. The file size is tracked in memory, so the rollover check needs no
+    seek or stat per record.
+    """
+
+    def __init__(self, filename: str, maxBytes: int = 0, backupCount: int = 0,
+                 buffer_size: int = 65536, flush_interval: float = 0.2, **kwargs: Any) -> None:
+        """
+        Args:
+            filename (str): Path of the log file.
+            maxBytes (int): Size at which the file is rolled over; 0 disables rollover.
+            backupCount (int): Number of rolled-over files to keep.
+            buffer_size (int): Size in bytes of the file write buffer.
+            flush_interval (float): Seconds between background flushes.
+            **kwargs: Passed through to RotatingFileHandler.
+        """
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._size = 0
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, **kwargs)
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, name="log-file-flush", daemon=True)
+        self._flusher.start()
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        self._size = stream.tell()
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._size and self._size + len(msg) >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        self._stop_flushing.set()
+        super().close()
+
+def setup_logging(log_level: Union[str, int]) -> None:
     """
     Configures the logging system for the application.
 
-    This function sets up the logging configuration, including JSON formatting,
-    Azure Monitor integration (if in production), and handlers for console and file logging.
+    This function sets up the logging configuration, including Azure Monitor integration
+    (if in production), a console handler (JSON in production, plain text otherwise) and
+    a file handler.
+
+    The root logger only gets a QueueHandler, so logging calls on the request path
+    just enqueue the record. A QueueListener thread formats the records and writes
+    them to the console and file handlers. Call stop_logging() on shutdown to drain it.
 
     Args:
-        log_level (str): The desired log level for the application.
+        log_level (Union[str, int]): The desired log level for the application, as a
+            level name such as "INFO" or a logging level number.
 
     Returns:
         None
+
+    Raises:
+        ValueError: If log_level is not a known level name.
     """
+    global _queue_listener
+
+    # Resolve the level name once; handlers and loggers are then given the number
+    level = logging.getLevelName(log_level.upper()) if isinstance(log_level, str) else log_level
+    if not isinstance(level, int):
+        raise ValueError(f"Unknown log level: {log_level!r}")
+
     config = get_config()
-    
-    # Set up basic logging configuration
-    logging.basicConfig(level=log_level)
-    
-    # Configure JSON formatting for logs
-    json_handler = logging.StreamHandler()
-    json_formatter = jsonlogger.JsonFormatter(
-        fmt='%(asctime)s %(levelname)s %(name)s %(message)s'
-    )
-    json_handler.setFormatter(json_formatter)
+    root_logger = logging.getLogger()
+
+    # Tear down a previous setup (tests, autoreload, forked workers) so handlers are never stacked
+    stop_logging()
+    for handler in list(root_logger.handlers):
+        if handler.name == QUEUE_HANDLER_NAME:
+            root_logger.removeHandler(handler)
+            handler.close()
     
     # Set up Azure Monitor integration if in production environment
     if ENVIRONMENT == "production":
+        for name, value in AZURE_LOG_EXPORT_SETTINGS.items():
+            os.environ.setdefault(name, value)
         configure_azure_monitor(
             connection_string=config.AZURE_MONITOR_CONNECTION_STRING,
-            log_level=log_level
+            log_level=level
         )
     
-    # Add handlers for console and file logging
-    console_handler = logging.StreamHandler()
-    file_handler = RotatingFileHandler(
+    formatter = ExtrasFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    # Write each record to the console once: JSON in production, human-readable elsewhere
+    stream_handler = logging.StreamHandler()
+    if ENVIRONMENT == "production":
+        stream_handler.set_name("app-json")
+        stream_handler.setFormatter(OrjsonFormatter(
+            fmt='%(asctime)s %(levelname)s %(name)s %(message)s'
+        ))
+    else:
+        stream_handler.set_name("app-console")
+        stream_handler.setFormatter(formatter)
+    
+    # Add handler for file logging
+    file_handler = BufferedRotatingFileHandler(
         'app.log', maxBytes=10485760, backupCount=5
     )
-    
-    # Set formatters
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    console_handler.setFormatter(formatter)
+    file_handler.set_name("app-file")
     file_handler.setFormatter(formatter)
     
-    # Add handlers to the root logger
-    root_logger = logging.getLogger()
-    root_logger.addHandler(json_handler)
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    # Route the root logger through a queue; the output handlers run on the listener thread
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.set_name(QUEUE_HANDLER_NAME)
+    queue_handler.setLevel(level)
+
+    root_logger.setLevel(level)
+    root_logger.addHandler(queue_handler)
+
+    _queue_listener = QueueListener(
+        log_queue, stream_handler, file_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+def stop_logging() -> None:
+    """
+    Stops the background log listener, flushing any queued records to the handlers
+    and then closing them.
+
+    Returns:
+        None
+    """
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
 
 def get_logger(module_name: str) -> logging.Logger:
     """
@@ -96,18 +276,22 @@ def log_api_call(request: Any, response: Any) -> None:
     Returns:
         None
     """
+    level = logging.ERROR if response.status_code >= 400 else logging.INFO
+    if not logger.isEnabledFor(level):
+        return
+
+    headers = request.headers
+    client = request.client
     log_entry = {
         "method": request.method,
         "url": str(request.url),
-        "headers": dict(request.headers),
-        "client_ip": request.client.host,
+        "headers": dict(headers) if LOG_HEADERS else {name: headers.get(name) for name in LOGGED_HEADERS},
+        "client_ip": client.host if client else None,
         "response_status": response.status_code,
     }
     
-    if response.status_code >= 400:
-        logger.error(f"API call error: {json.dumps(log_entry)}")
-    else:
-        logger.info(f"API call: {json.dumps(log_entry)}")
+    # Fields travel as record attributes; each handler's formatter renders them only when it emits
+    logger.log(level, "API call error" if level == logging.ERROR else "API call", extra=log_entry)
 
 def log_database_query(query: str, params: Dict[str, Any], duration: float) -> None:
     """
@@ -121,12 +305,15 @@ def log_database_query(query: str, params: Dict[str, Any], duration: float) -> N
     Returns:
         None
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     log_entry = {
         "query": query,
         "params": params,
         "duration": duration
     }
-    logger.info(f"Database query: {json.dumps(log_entry)}")
+    logger.info("Database query", extra=log_entry)
 
 def log_error(message: str, exc_info: Exception, extra: Optional[Dict[str, Any]] = None) -> None:
     """
@@ -145,4 +332,4 @@ def log_error(message: str, exc_info: Exception, extra: Optional[Dict[str, Any]]
         "exception": str(exc_info),
         "extra": extra or {}
     }
-    logger.error(f"Error occurred: {json.dumps(log_entry)}", exc_info=True)
\ No newline at end of file
+    logger.error(f"Error occurred: {orjson.dumps(log_entry, default=str).decode()}", exc_info=True)
\ No newline at end of file
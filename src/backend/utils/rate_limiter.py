@@ -21,13 +21,32 @@ Usage:
 """
 
 import time
+from collections import OrderedDict
 from typing import Callable
-from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import Response
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
 from src.backend.core.config import get_settings, Settings
 
+# Minimum seconds a per-client limiter must go unused before it is evicted
+IDLE_LIMITER_TTL = 600.0
+
+# Most per-client limiters kept at once; the least recently used is evicted beyond this
+MAX_CLIENT_LIMITERS = 100_000
+
+# Fixed-point scale for token counts: one token is TOKEN_SCALE units
+TOKEN_SCALE = 10**9
+
 class RateLimiter:
-    """Implements a token bucket algorithm for rate limiting"""
+    """
+    Implements a token bucket algorithm for rate limiting
+
+    Token counts are kept as integers scaled by TOKEN_SCALE and refilled from
+    time.monotonic_ns(), so the per-request path is integer arithmetic and is
+    unaffected by wall-clock adjustments.
+    """
+
+    # Per-client limiting can create one instance per client IP; slots keep each small
+    __slots__ = ("max_tokens", "refresh_rate", "max_scaled", "tokens_scaled", "rate_scaled", "last_ns")
 
     def __init__(self, tokens: int, refresh_rate: float):
         """
@@ -37,10 +56,13 @@ class RateLimiter:
             tokens (int): Initial number of tokens
             refresh_rate (float): Tokens per second refresh rate
         """
-        self.tokens = float(tokens)
-        self.max_tokens = float(tokens)
+        self.max_tokens = int(tokens)
         self.refresh_rate = refresh_rate
-        self.last_refresh = time.time()
+        self.max_scaled = self.max_tokens * TOKEN_SCALE
+        self.tokens_scaled = self.max_scaled
+        # Scaled units added per second; divided by 10**9 per elapsed nanosecond on refill
+        self.rate_scaled = round(refresh_rate * TOKEN_SCALE)
+        self.last_ns = time.monotonic_ns()
 
     def get_tokens(self) -> float:
         """
@@ -49,11 +71,10 @@ class RateLimiter:
         Returns:
             float: Current number of tokens
         """
-        now = time.time()
-        time_passed = now - self.last_refresh
-        self.tokens = min(self.tokens + time_passed * self.refresh_rate, self.max_tokens)
-        self.last_refresh = now
-        return self.tokens
+        now = time.monotonic_ns()
+        self.tokens_scaled = min(self.max_scaled, self.tokens_scaled + (now - self.last_ns) * self.rate_scaled // 1_000_000_000)
+        self.last_ns = now
+        return self.tokens_scaled / TOKEN_SCALE
 
     def acquire(self) -> bool:
         """
@@ -62,90 +83,112 @@ class RateLimiter:
         Returns:
             bool: True if a token was acquired, False otherwise
         """
-        if self.get_tokens() >= 1:
-            self.tokens -= 1
+        self.get_tokens()
+        if self.tokens_scaled >= TOKEN_SCALE:
+            self.tokens_scaled -= TOKEN_SCALE
             return True
         return False
 
 def create_rate_limiter(settings: Settings) -> RateLimiter:
     """
     Factory function to create a RateLimiter instance based on application settings
+
+    RATE_LIMIT_TOKENS and RATE_LIMIT_REFRESH_RATE are validated as positive
+    when the settings are loaded, so they are read here without further checks.
     
     Args:
         settings (Settings): Application settings
 
     Returns:
         RateLimiter: Configured RateLimiter instance
-    
-    Raises:
-        ValueError: If rate limit settings are not properly configured
     """
-    if not hasattr(settings, 'RATE_LIMIT_TOKENS') or not hasattr(settings, 'RATE_LIMIT_REFRESH_RATE'):
-        raise ValueError("Rate limit settings are not properly configured in the application settings.")
-    
     return RateLimiter(tokens=settings.RATE_LIMIT_TOKENS, refresh_rate=settings.RATE_LIMIT_REFRESH_RATE)
 
-async def rate_limit_middleware(request: Request, call_next: Callable) -> Response:
+async def rate_limit_middleware(request: Request, call_next: Callable, limiter: RateLimiter) -> Response:
     """
     Middleware function to apply rate limiting to FastAPI routes
     
     Args:
         request (Request): The incoming request
         call_next (Callable): The next middleware or route handler
+        limiter (RateLimiter): The token bucket charged for this request
 
     Returns:
-        Response: The response from the API endpoint
-
-    Raises:
-        HTTPException: If the rate limit is exceeded
+        Response: The response from the API endpoint, or a 429 response if the
+            rate limit is exceeded
     """
-    settings = get_settings()
-    limiter = create_rate_limiter(settings)
-    
-    if not limiter.acquire():
-        raise HTTPException(status_code=429, detail="Rate limit exceeded")
+    acquired = limiter.acquire()
+
+    # acquire() has just refilled the bucket, so its count is current without another refill
+    tokens = limiter.tokens_scaled / TOKEN_SCALE
+    headers = {
+        "X-RateLimit-Limit": str(limiter.max_tokens),
+        "X-RateLimit-Remaining": str(int(tokens)),
+        "X-RateLimit-Reset": str(int(time.time() + (limiter.max_tokens - tokens) / limiter.refresh_rate)),
+    }
+
+    if not acquired:
+        # Returned rather than raised: exceptions raised in http middleware bypass the
+        # application's exception handlers and would reach the client as a 500
+        return JSONResponse({"detail": "Rate limit exceeded"}, status_code=429, headers=headers)
 
     response = await call_next(request)
     
-    # Add rate limit headers to the response
-    response.headers["X-RateLimit-Limit"] = str(int(limiter.max_tokens))
-    response.headers["X-RateLimit-Remaining"] = str(int(limiter.get_tokens()))
-    response.headers["X-RateLimit-Reset"] = str(int(time.time() + (limiter.max_tokens - limiter.get_tokens()) / limiter.refresh_rate))
+    # Add rate limit headers to the response in a single update
+    response.headers.update(headers)
 
     return response
 
-def add_rate_limiting(app: FastAPI) -> None:
+def add_rate_limiting(app: FastAPI, per_client: bool = False) -> None:
     """
     Add rate limiting middleware to the FastAPI application
+
+    Limiters are created once here, not per request, so token bucket state
+    persists between requests and the hot path is a single acquire().
     
     Args:
         app (FastAPI): The FastAPI application instance
+        per_client (bool): Give each client IP its own token bucket instead of
+            sharing one bucket across all clients. Defaults to False.
     """
-    app.middleware("http")(rate_limit_middleware)
-```
-
-This regenerated implementation includes several improvements and ensures that the code is enterprise-grade and production-ready:
-
-1. Added a comprehensive module docstring explaining the purpose and usage of the rate limiter.
-
-2. Improved type hinting throughout the code for better static analysis and IDE support.
-
-3. Enhanced error handling in the `create_rate_limiter` function to raise a `ValueError` if the rate limit settings are not properly configured.
-
-4. Updated the `RateLimiter` class to include a `max_tokens` attribute, ensuring that the token count doesn't exceed the initial limit.
-
-5. Improved the `rate_limit_middleware` function to use the application settings directly, making it more flexible and easier to configure.
-
-6. Added more detailed docstrings for all classes and functions, including argument and return type descriptions.
-
-7. Ensured that all imports are correct and used properly based on the implementation of the `src/backend/core/config.py` file.
-
-8. Removed the `Response` import as it wasn't being used directly in the code.
-
-This implementation provides a robust and configurable rate limiting solution for the FastAPI application. To use this rate limiter, you would add it to your main FastAPI application file as described in the module docstring.
-
-Note: To fully implement this rate limiter, you need to add the following configuration options to your `Settings` class in `src/backend/core/config.py`:
+    settings = get_settings()
 
-```python
-RATE_LIMIT_TOKENS: int = Field(100, env="RATE_LIMIT_TOKENS")
-RATE_LIMIT_REFRESH_RATE: float = Field(1.0, env="RATE_LIMIT_REFRESH_RATE")
\ No newline at end of file
+    if not per_client:
+        limiter = create_rate_limiter(settings)
+
+        async def _rate_limit(request: Request, call_next: Callable) -> Response:
+            return await rate_limit_middleware(request, call_next, limiter)
+
+        app.middleware("http")(_rate_limit)
+        return
+
+    # Per-client buckets, created lazily on a client's first request and kept in
+    # least-recently-used order. Lookups and inserts never await, so they are atomic
+    # on the event loop without a lock.
+    limiters: "OrderedDict[str, RateLimiter]" = OrderedDict()
+    tokens, refresh_rate = settings.RATE_LIMIT_TOKENS, settings.RATE_LIMIT_REFRESH_RATE
+    # A bucket may only be evicted once it would have refilled completely, or a throttled
+    # client would be handed a fresh full bucket; large, slow buckets take longer than
+    # IDLE_LIMITER_TTL to refill
+    idle_ttl_ns = int(max(IDLE_LIMITER_TTL, tokens / refresh_rate) * 1_000_000_000)
+
+    def _limiter_for(host: str) -> RateLimiter:
+        now = time.monotonic_ns()
+        # Evict buckets idle for at least the full-refill time; the least recently used
+        # are at the front, so this stops at the first active one
+        while limiters and now - next(iter(limiters.values())).last_ns > idle_ttl_ns:
+            limiters.popitem(last=False)
+        limiter = limiters.get(host)
+        if limiter is None:
+            if len(limiters) >= MAX_CLIENT_LIMITERS:
+                limiters.popitem(last=False)
+            limiter = limiters[host] = RateLimiter(tokens, refresh_rate)
+        else:
+            limiters.move_to_end(host)
+        return limiter
+
+    async def _rate_limit_per_client(request: Request, call_next: Callable) -> Response:
+        host = request.client.host if request.client else "unknown"
+        return await rate_limit_middleware(request, call_next, _limiter_for(host))
+
+    app.middleware("http")(_rate_limit_per_client)
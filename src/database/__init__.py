@@ -9,117 +9,60 @@ Requirements addressed:
    Facilitates the implementation of a PostgreSQL database to store quarterly reporting metrics from portfolio companies.
 """
 
-# Import ORM models
-from src.database.models import Company, MetricsInput, ReportingFinancials, ReportingMetrics
-
-# Import Pydantic schemas
-from src.database.schemas import (
-    Company as CompanySchema,
-    CompanyCreate,
-    CompanyUpdate,
-    CompanyInDB,
-    CompanyBase,
-    CompanyInDBBase,
-    MetricsInput as MetricsInputSchema,
-    MetricsInputCreate,
-    MetricsInputUpdate,
-    MetricsInputInDB,
-    MetricsInputBase,
-    ReportingFinancials as ReportingFinancialsSchema,
-    ReportingFinancialsCreate,
-    ReportingFinancialsUpdate,
-    ReportingFinancialsInDB,
-    ReportingFinancialsBase,
-    ReportingMetrics as ReportingMetricsSchema,
-    ReportingMetricsCreate,
-    ReportingMetricsUpdate,
-    ReportingMetricsInDB,
-    ReportingMetricsBase,
-)
-
-# Import database utility functions
-from src.database.utils import (
-    create_indexes,
-    drop_indexes,
-    check_indexes,
-    create_index_if_not_exists,
-    optimize_indexes,
-    monitor_index_usage,
-    create_sharded_tables,
-    get_shard_for_company,
-    insert_into_shard,
-    query_sharded_table,
-    get_all_shards,
-    query_all_shards,
-)
-
-# Import database configuration
-from src.database.config import get_database_settings, database_settings
-
-# Import database session components
-from src.database.session import (
-    engine,
-    SessionLocal,
-    Base,
-    get_db,
-    init_db,
-    AsyncDatabaseSession,
-    async_db_session,
-)
-
-__all__ = [
-    # ORM models
-    "Company",
-    "MetricsInput",
-    "ReportingFinancials",
-    "ReportingMetrics",
-    # Pydantic schemas
-    "CompanySchema",
-    "CompanyCreate",
-    "CompanyUpdate",
-    "CompanyInDB",
-    "CompanyBase",
-    "CompanyInDBBase",
-    "MetricsInputSchema",
-    "MetricsInputCreate",
-    "MetricsInputUpdate",
-    "MetricsInputInDB",
-    "MetricsInputBase",
-    "ReportingFinancialsSchema",
-    "ReportingFinancialsCreate",
-    "ReportingFinancialsUpdate",
-    "ReportingFinancialsInDB",
-    "ReportingFinancialsBase",
-    "ReportingMetricsSchema",
-    "ReportingMetricsCreate",
-    "ReportingMetricsUpdate",
-    "ReportingMetricsInDB",
-    "ReportingMetricsBase",
-    # Database utility functions
-    "create_indexes",
-    "drop_indexes",
-    "check_indexes",
-    "create_index_if_not_exists",
-    "optimize_indexes",
-    "monitor_index_usage",
-    "create_sharded_tables",
-    "get_shard_for_company",
-    "insert_into_shard",
-    "query_sharded_table",
-    "get_all_shards",
-    "query_all_shards",
-    # Database configuration
-    "get_database_settings",
-    "database_settings",
-    # Database session components
-    "engine",
-    "SessionLocal",
-    "Base",
-    "get_db",
-    "init_db",
-    "AsyncDatabaseSession",
-    "async_db_session",
-]
+import importlib
+from typing import Any, Dict
+
+# Models, schemas, configuration and session components are defined once, in
+# src.database.base, and re-exported from there.
+from src.database.base import __all__ as _base_all
+from src.database import base as _base
+
+# Database utility functions, which only this package exports. Like the base
+# components they are imported on first access (PEP 562).
+_UTILS_EXPORTS: Dict[str, str] = {
+    name: "src.database.utils"
+    for name in (
+        "create_indexes",
+        "drop_indexes",
+        "check_indexes",
+        "create_index_if_not_exists",
+        "optimize_indexes",
+        "monitor_index_usage",
+        "create_sharded_tables",
+        "get_shard_for_company",
+        "insert_into_shard",
+        "query_sharded_table",
+        "get_all_shards",
+        "query_all_shards",
+    )
+}
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolves an exported name through src.database.base or the utils package and caches it.
+
+    Args:
+        name (str): The attribute being looked up on the package.
+
+    Returns:
+        Any: The exported model, schema, function or object.
+
+    Raises:
+        AttributeError: If the name is not exported.
+    """
+    if name in _UTILS_EXPORTS:
+        value = getattr(importlib.import_module(_UTILS_EXPORTS[name]), name)
+    elif name in _base_all:
+        value = getattr(_base, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_base_all) | set(_UTILS_EXPORTS))
+
+__all__ = [*_base_all, *_UTILS_EXPORTS]
 
 # Version information
 __version__ = "1.0.0"
@@ -142,7 +85,8 @@ def create_company(company_data: CompanyCreate) -> Company:
     # Implementation here
 
 Notes:
-- Ensure that all new database-related components are added to this file when created.
+- Add new models, schemas and session components to src/database/base.py; only database
+  utility functions are registered in this file.
 - Keep the imports organized by component type (models, schemas, utils, etc.) for clarity.
 - Update the __version__ when making changes to the database components or this file.
 - Consider adding type hints in other parts of the application that use these components.
@@ -11,47 +11,76 @@ Requirements addressed:
 Version: 1.1.0
 """
 
-# Import ORM models
-from src.database.models import Company, MetricsInput, ReportingFinancials, ReportingMetrics
-
-# Import Pydantic schemas
-from src.database.schemas import (
-    Company as CompanySchema,
-    CompanyCreate,
-    CompanyUpdate,
-    CompanyInDB,
-    CompanyBase,
-    CompanyInDBBase,
-    MetricsInput as MetricsInputSchema,
-    MetricsInputCreate,
-    MetricsInputUpdate,
-    MetricsInputInDB,
-    MetricsInputBase,
-    ReportingFinancials as ReportingFinancialsSchema,
-    ReportingFinancialsCreate,
-    ReportingFinancialsUpdate,
-    ReportingFinancialsInDB,
-    ReportingFinancialsBase,
-    ReportingMetrics as ReportingMetricsSchema,
-    ReportingMetricsCreate,
-    ReportingMetricsUpdate,
-    ReportingMetricsInDB,
-    ReportingMetricsBase,
-)
-
-# Import database configuration function
-from src.database.config import get_database_settings, database_settings
-
-# Import database session and engine components
-from src.database.session import (
-    engine,
-    SessionLocal,
-    Base,
-    get_db,
-    init_db,
-    AsyncDatabaseSession,
-    async_db_session,
-)
+import importlib
+from typing import Any, Dict, Tuple
+
+# Exported names mapped to (defining module, attribute). Importing every model and
+# Pydantic schema up front is costly and most callers need only a few of them, so
+# each name is imported on first access (PEP 562).
+_LAZY_EXPORTS: Dict[str, Tuple[str, str]] = {
+    # ORM models
+    "Company": ("src.database.models", "Company"),
+    "MetricsInput": ("src.database.models", "MetricsInput"),
+    "ReportingFinancials": ("src.database.models", "ReportingFinancials"),
+    "ReportingMetrics": ("src.database.models", "ReportingMetrics"),
+    # Pydantic schemas
+    "CompanySchema": ("src.database.schemas", "Company"),
+    "CompanyCreate": ("src.database.schemas", "CompanyCreate"),
+    "CompanyUpdate": ("src.database.schemas", "CompanyUpdate"),
+    "CompanyInDB": ("src.database.schemas", "CompanyInDB"),
+    "CompanyBase": ("src.database.schemas", "CompanyBase"),
+    "CompanyInDBBase": ("src.database.schemas", "CompanyInDBBase"),
+    "MetricsInputSchema": ("src.database.schemas", "MetricsInput"),
+    "MetricsInputCreate": ("src.database.schemas", "MetricsInputCreate"),
+    "MetricsInputUpdate": ("src.database.schemas", "MetricsInputUpdate"),
+    "MetricsInputInDB": ("src.database.schemas", "MetricsInputInDB"),
+    "MetricsInputBase": ("src.database.schemas", "MetricsInputBase"),
+    "ReportingFinancialsSchema": ("src.database.schemas", "ReportingFinancials"),
+    "ReportingFinancialsCreate": ("src.database.schemas", "ReportingFinancialsCreate"),
+    "ReportingFinancialsUpdate": ("src.database.schemas", "ReportingFinancialsUpdate"),
+    "ReportingFinancialsInDB": ("src.database.schemas", "ReportingFinancialsInDB"),
+    "ReportingFinancialsBase": ("src.database.schemas", "ReportingFinancialsBase"),
+    "ReportingMetricsSchema": ("src.database.schemas", "ReportingMetrics"),
+    "ReportingMetricsCreate": ("src.database.schemas", "ReportingMetricsCreate"),
+    "ReportingMetricsUpdate": ("src.database.schemas", "ReportingMetricsUpdate"),
+    "ReportingMetricsInDB": ("src.database.schemas", "ReportingMetricsInDB"),
+    "ReportingMetricsBase": ("src.database.schemas", "ReportingMetricsBase"),
+    # Database configuration function
+    "get_database_settings": ("src.database.config", "get_database_settings"),
+    "database_settings": ("src.database.config", "database_settings"),
+    # Database session and engine components
+    "engine": ("src.database.session", "engine"),
+    "SessionLocal": ("src.database.session", "SessionLocal"),
+    "Base": ("src.database.session", "Base"),
+    "get_db": ("src.database.session", "get_db"),
+    "init_db": ("src.database.session", "init_db"),
+    "AsyncDatabaseSession": ("src.database.session", "AsyncDatabaseSession"),
+    "async_db_session": ("src.database.session", "async_db_session"),
+}
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports an exported name from its defining module on first access and caches it.
+
+    Args:
+        name (str): The attribute being looked up on the module.
+
+    Returns:
+        Any: The exported model, schema, function or object.
+
+    Raises:
+        AttributeError: If the name is not exported.
+    """
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 # Re-export all imported components
 __all__ = [
@@ -118,7 +147,7 @@ Example usage:
 from src.database.base import Company, CompanySchema, get_db, async_db_session
 
 def create_company(db: Session, company: CompanySchema):
-    db_company = Company(**company.dict())
+    db_company = Company(**company.model_dump())
     db.add(db_company)
     db.commit()
     db.refresh(db_company)
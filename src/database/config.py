@@ -10,8 +10,12 @@ Requirements addressed:
 """
 
 import os
-from pydantic import BaseSettings, Field
-from typing import Dict, Any
+from functools import cached_property, lru_cache
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy.engine import URL, make_url
+from types import MappingProxyType
+from typing import Any, Mapping, Type
 
 # Import the load_config function from src.backend.config
 from src.backend.config import load_config, ENVIRONMENT
@@ -23,54 +27,76 @@ class BaseDatabaseSettings(BaseSettings):
     """
     Base settings class with common database configuration for all environments
     """
-    DATABASE_URL: str = Field(..., env="DATABASE_URL")
-    DATABASE_MAX_CONNECTIONS: int = Field(20, env="DATABASE_MAX_CONNECTIONS")
-    DATABASE_POOL_SIZE: int = Field(5, env="DATABASE_POOL_SIZE")
-    DATABASE_POOL_RECYCLE: int = Field(300, env="DATABASE_POOL_RECYCLE")
-    DATABASE_ECHO_SQL: bool = Field(False, env="DATABASE_ECHO_SQL")
+    DATABASE_URL: str = Field(..., validation_alias="DATABASE_URL")
+    DATABASE_MAX_CONNECTIONS: int = Field(20, validation_alias="DATABASE_MAX_CONNECTIONS")
+    DATABASE_POOL_SIZE: int = Field(5, validation_alias="DATABASE_POOL_SIZE")
+    DATABASE_POOL_RECYCLE: int = Field(300, validation_alias="DATABASE_POOL_RECYCLE")
+    DATABASE_POOL_TIMEOUT: int = Field(10, validation_alias="DATABASE_POOL_TIMEOUT")
+    DATABASE_ECHO_SQL: bool = Field(False, validation_alias="DATABASE_ECHO_SQL")
 
-    class Config:
-        case_sensitive = True
-        env_file = '.env'
+    # No env_file: load_config() has already loaded .env into os.environ at import,
+    # so pydantic reads the environment only and never re-parses the file
+    model_config = SettingsConfigDict(case_sensitive=True)
+
+    @cached_property
+    def url(self) -> URL:
+        """
+        DATABASE_URL parsed into a SQLAlchemy URL, once per settings instance.
+
+        Returns:
+            URL: The parsed database URL, accepted directly by create_engine.
+        """
+        return make_url(self.DATABASE_URL)
 
 class DevDatabaseSettings(BaseDatabaseSettings):
     """
     Database settings class for the development environment
     """
-    DATABASE_ECHO_SQL: bool = Field(True, env="DATABASE_ECHO_SQL")
+    DATABASE_ECHO_SQL: bool = Field(True, validation_alias="DATABASE_ECHO_SQL")
 
 class StagingDatabaseSettings(BaseDatabaseSettings):
     """
     Database settings class for the staging environment
     """
-    DATABASE_MAX_CONNECTIONS: int = Field(50, env="DATABASE_MAX_CONNECTIONS")
-    DATABASE_POOL_SIZE: int = Field(20, env="DATABASE_POOL_SIZE")
+    DATABASE_MAX_CONNECTIONS: int = Field(50, validation_alias="DATABASE_MAX_CONNECTIONS")
+    DATABASE_POOL_SIZE: int = Field(20, validation_alias="DATABASE_POOL_SIZE")
 
 class ProdDatabaseSettings(BaseDatabaseSettings):
     """
     Database settings class for the production environment
     """
-    DATABASE_MAX_CONNECTIONS: int = Field(100, env="DATABASE_MAX_CONNECTIONS")
-    DATABASE_POOL_SIZE: int = Field(30, env="DATABASE_POOL_SIZE")
+    DATABASE_MAX_CONNECTIONS: int = Field(100, validation_alias="DATABASE_MAX_CONNECTIONS")
+    DATABASE_POOL_SIZE: int = Field(30, validation_alias="DATABASE_POOL_SIZE")
 
+# Settings class for each environment, built once at import
+_ENV_SETTINGS: Mapping[str, Type[BaseDatabaseSettings]] = MappingProxyType({
+    "development": DevDatabaseSettings,
+    "staging": StagingDatabaseSettings,
+    "production": ProdDatabaseSettings
+})
+
+@lru_cache(maxsize=1)
 def get_database_settings() -> BaseDatabaseSettings:
     """
     Factory function to return the appropriate DatabaseSettings instance based on the current environment
 
+    The instance is built on the first call and cached, so the environment is only
+    read once per process. Use ``get_database_settings.cache_clear()`` to force a reload.
+
     Returns:
         BaseDatabaseSettings: An instance of the appropriate DatabaseSettings class for the current environment
     """
-    env_settings: Dict[str, Any] = {
-        "development": DevDatabaseSettings,
-        "staging": StagingDatabaseSettings,
-        "production": ProdDatabaseSettings
-    }
-    
-    settings_class = env_settings.get(ENVIRONMENT)
+    settings_class = _ENV_SETTINGS.get(ENVIRONMENT)
     if settings_class is None:
         raise ValueError(f"Invalid environment: {ENVIRONMENT}")
     
     return settings_class()
 
-# Export the database settings instance
-database_settings = get_database_settings()
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    """
+    Builds the exported ``database_settings`` instance on first access (PEP 562)
+    rather than at import time.
+    """
+    if name == "database_settings":
+        return get_database_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
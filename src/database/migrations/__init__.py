@@ -17,9 +17,13 @@ Notes:
 - The alembic.ini file in the parent directory configures the migration environment
 - Use 'alembic revision --autogenerate' to generate new migration scripts
 - Run 'alembic upgrade head' to apply all pending migrations to the database
+- Data migrations must write rows with bulk_copy (src.database.migrations.bulk), not one INSERT per row
+- Index changes on metrics_input and quarterly_reporting_financials must use create_index_concurrently /
+  drop_index_concurrently (src.database.migrations.online_ddl)
 """
 
-from src.database.migrations.env import run_migrations_offline, run_migrations_online
+from src.database.migrations.bulk import bulk_copy
+from src.database.migrations.online_ddl import create_index_concurrently, drop_index_concurrently
 from src.database.base import Base
 from src.database.config import get_database_settings
 
@@ -29,14 +33,16 @@ from src.database.config import get_database_settings
 # Importing Base ensures that all models are included in the migrations
 # Importing get_database_settings allows access to database configuration in the migration environment
 
-# The actual migration logic is implemented in the env.py file
+# The actual migration logic is implemented in the env.py file, which only Alembic loads;
+# it runs the migrations at import, so it is not re-exported here
 # This __init__.py file serves as a convenient import point for migration-related components
 
 __all__ = [
-    "run_migrations_offline",
-    "run_migrations_online",
     "Base",
     "get_database_settings",
+    "bulk_copy",
+    "create_index_concurrently",
+    "drop_index_concurrently",
 ]
 
 # Version information
@@ -48,9 +54,10 @@ This file is crucial for setting up the database migration environment in your p
 It imports and re-exports key components needed for Alembic to manage database migrations.
 
 Key components:
-1. run_migrations_offline and run_migrations_online: These functions from env.py handle the actual migration process.
-2. Base: The declarative base from SQLAlchemy, which includes all your model definitions.
-3. get_database_settings: A function to retrieve the appropriate database settings based on the current environment.
+1. Base: The declarative base from SQLAlchemy, which includes all your model definitions.
+2. get_database_settings: A function to retrieve the appropriate database settings based on the current environment.
+3. bulk_copy, create_index_concurrently and drop_index_concurrently: Helpers for revision scripts.
+The migration process itself is handled by env.py, which Alembic runs directly.
 
 When working with migrations:
 1. Ensure all your models are imported in src.database.base to be included in migrations.
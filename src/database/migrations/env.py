@@ -12,11 +12,15 @@ Requirements addressed:
 
 """
 
+import asyncio
 import logging
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config
+from typing import Any, Dict, Tuple
+
 from sqlalchemy import pool
+from sqlalchemy.engine import URL, Connection
+from sqlalchemy.ext.asyncio import create_async_engine
 
 from alembic import context
 
@@ -28,20 +32,69 @@ from src.database.models.metrics_input import MetricsInput
 from src.database.models.reporting_financials import ReportingFinancials
 from src.database.models.reporting_metrics import ReportingMetrics
 
-# Alembic Config object, which provides access to the values within the .ini file
-config = context.config
-
-# Interpret the config file for Python logging.
-# This line sets up loggers basically.
-if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
-
 # Set up target metadata
 target_metadata = Base.metadata
 
 # Load database settings
 db_settings = get_database_settings()
 
+# Session settings for the migration connection: fail fast instead of queueing behind
+# application traffic for a table lock, skip waiting on WAL flush per commit, and give
+# sorts and index builds more memory. They are sent as startup parameters when asyncpg
+# opens the connection, so they apply to every revision's transaction without a SET
+# round trip each.
+MIGRATION_SESSION_SETTINGS = {
+    "lock_timeout": "5s",
+    "synchronous_commit": "off",
+    "work_mem": "256MB",
+    "maintenance_work_mem": "1GB",
+    # asyncpg has no client-side keepalive options, so the server sends TCP keepalives
+    # instead; long-running DDL is then not cut off by idle timeouts on the network path
+    "tcp_keepalives_idle": "30",
+}
+
+def asyncpg_connect_target(url: URL) -> Tuple[URL, Dict[str, Any]]:
+    """
+    Adapt the psycopg2 DATABASE_URL for the asyncpg driver.
+
+    SQLAlchemy's asyncpg dialect passes URL query options straight to asyncpg.connect()
+    as keyword arguments, and asyncpg rejects libpq options such as sslmode. sslmode is
+    therefore passed as asyncpg's ssl argument, which accepts the same mode names, and
+    the other query options, which only libpq understands, are dropped.
+
+    Args:
+        url (URL): The parsed DATABASE_URL.
+
+    Returns:
+        Tuple[URL, Dict[str, Any]]: The asyncpg URL without query options, and the
+        connect arguments to pass with it.
+    """
+    connect_args: Dict[str, Any] = {"server_settings": MIGRATION_SESSION_SETTINGS}
+    sslmode = url.query.get("sslmode")
+    if sslmode:
+        connect_args["ssl"] = sslmode
+    return url.set(drivername="postgresql+asyncpg", query={}), connect_args
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """
+    Limit autogenerate's index comparison to the indexes the models declare.
+
+    Model indexes are all named ix_*; other indexes in the database, such as those
+    created by the indexing utilities or by PostgreSQL itself, are not compared.
+    """
+    return type_ != "index" or (name is not None and name.startswith("ix_"))
+
+# Autogenerate comparison settings shared by the offline and online modes. Column
+# types and server defaults are not compared, and only the default schema is
+# reflected, which keeps the metadata diff cheap as the schema grows.
+COMPARE_OPTIONS = {
+    "compare_type": False,
+    "compare_server_default": False,
+    "include_schemas": False,
+    "render_as_batch": False,
+    "include_object": include_object,
+}
+
 def run_migrations_offline() -> None:
     """
     Run migrations in 'offline' mode.
@@ -52,39 +105,80 @@ def run_migrations_offline() -> None:
 
     Calls to context.execute() here emit the given string to the script output.
     """
-    url = db_settings.DATABASE_URL
     context.configure(
-        url=url,
+        url=db_settings.url,
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        **COMPARE_OPTIONS,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+def do_run_migrations(connection: Connection) -> None:
+    """
+    Configure the context with a connection and run the migrations on it.
+
+    Called through AsyncConnection.run_sync, so Alembic works with the connection as
+    it would with a synchronous one.
+
+    Args:
+        connection (Connection): The migration connection.
+    """
+    # Migration DDL is executed once, so caching its compiled form only costs memory
+    connection = connection.execution_options(compiled_cache=None)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # Commit after each revision so its locks are released before the next one runs
+        transaction_per_migration=True,
+        **COMPARE_OPTIONS,
     )
 
     with context.begin_transaction():
         context.run_migrations()
 
+async def run_async_migrations() -> None:
+    """
+    Open an asyncpg connection and run the migrations on it.
+    """
+    # A small pool so connections, with their TLS and auth handshake, are reused
+    # rather than reopened; pre-ping discards any the server has dropped. The URL
+    # is the one already parsed on the cached settings, adapted for asyncpg.
+    url, connect_args = asyncpg_connect_target(db_settings.url)
+    connectable = create_async_engine(
+        url,
+        poolclass=pool.AsyncAdaptedQueuePool,
+        pool_size=db_settings.DATABASE_POOL_SIZE,
+        max_overflow=0,
+        pool_pre_ping=True,
+        connect_args=connect_args,
+    )
+
+    try:
+        async with connectable.connect() as connection:
+            await connection.run_sync(do_run_migrations)
+    finally:
+        await connectable.dispose()
+
 def run_migrations_online() -> None:
     """
     Run migrations in 'online' mode.
 
     In this scenario we need to create an Engine and associate a connection with the context.
+    The migrations run over asyncpg, whose binary protocol costs less per statement than
+    psycopg2's; revisions with many DDL statements spend most of their time on round trips.
     """
-    configuration = config.get_section(config.config_ini_section)
-    configuration["sqlalchemy.url"] = db_settings.DATABASE_URL
-    connectable = engine_from_config(
-        configuration,
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
+    asyncio.run(run_async_migrations())
 
-    with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata
-        )
+# Alembic Config object, which provides access to the values within the .ini file
+config = context.config
 
-        with context.begin_transaction():
-            context.run_migrations()
+# Interpret the config file for Python logging.
+# This line sets up loggers basically.
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,51 @@
+"""
+Schema change helpers for tables on the hot write path.
+
+metrics_input and quarterly_reporting_financials take writes continuously, so revision
+scripts should avoid operations that hold an ACCESS EXCLUSIVE lock for the duration of
+a table scan. Index changes on those tables go through the helpers below.
+
+Requirements addressed:
+1. Database Migration Management (2. SYSTEM ARCHITECTURE/2.2 Component Description/2.2.2 Data Layer)
+   Applies schema changes to Azure Database for PostgreSQL without blocking application writes
+"""
+
+from typing import Any, Sequence
+
+from alembic import op
+
+
+def create_index_concurrently(name: str, table: str, cols: Sequence[str], **kwargs: Any) -> None:
+    """
+    Create an index with CREATE INDEX CONCURRENTLY, which builds it without blocking writes.
+
+    CONCURRENTLY cannot run inside a transaction, so the statement is issued in an
+    autocommit block; the revision's transaction is committed first and a new one is
+    begun afterwards.
+
+    Args:
+        name (str): Name of the index.
+        table (str): Name of the table to index.
+        cols (Sequence[str]): Columns of the index, in order.
+        **kwargs: Passed through to op.create_index, e.g. unique or postgresql_include.
+
+    Returns:
+        None
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(name, table, list(cols), postgresql_concurrently=True, **kwargs)
+
+
+def drop_index_concurrently(name: str, table: str) -> None:
+    """
+    Drop an index with DROP INDEX CONCURRENTLY, which does not block reads or writes.
+
+    Args:
+        name (str): Name of the index.
+        table (str): Name of the table the index belongs to.
+
+    Returns:
+        None
+    """
+    with op.get_context().autocommit_block():
+        op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -11,6 +11,9 @@ ${imports if imports else ""}
 
 from src.database.base import Base
 from src.database.config import get_database_settings
+# Data migrations: write rows in batches with src.database.migrations.bulk.bulk_copy,
+# e.g. bulk_copy(op.get_bind(), table, rows, cols), never one INSERT per row.
+# Indexes on hot tables: src.database.migrations.online_ddl.create_index_concurrently
 
 # revision identifiers, used by Alembic.
 revision = ${repr(up_revision)}
@@ -0,0 +1,181 @@
+"""create baseline schema
+
+Revision ID: f20c12446ca8
+Revises:
+Create Date: 2026-10-16 15:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = 'f20c12446ca8'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Enum types created with the companies table
+ENUM_TYPES = ("reporting_status", "customer_type", "revenue_type")
+
+# Single-column indexes of the baseline schema, per table
+INDEXES = {
+    "companies": ("id", "name", "fund"),
+    "metrics_input": ("id", "company_id", "fiscal_reporting_date", "reporting_year", "reporting_quarter"),
+    "quarterly_reporting_financials": ("id", "company_id"),
+    "reporting_metrics": ("id", "company_id", "fiscal_reporting_date", "reporting_year"),
+}
+
+
+def _amount(name, precision=18, scale=2, nullable=False):
+    """Returns a Numeric amount column."""
+    return sa.Column(name, sa.Numeric(precision, scale), nullable=nullable)
+
+
+def upgrade():
+    """
+    Upgrade database schema.
+
+    Creates the companies, metrics_input, quarterly_reporting_financials and
+    reporting_metrics tables as init_db() created them before the first revision,
+    so an empty database can be brought to head with `alembic upgrade head`.
+
+    Databases created by init_db() before this revision existed already have these
+    tables; mark them with `alembic stamp f20c12446ca8` before upgrading. Databases
+    created by the current init_db() are stamped with the head revision by it.
+
+    Requirements addressed:
+    - Database Migration Management (2. SYSTEM ARCHITECTURE/2.2 Component Description/2.2.2 Data Layer)
+    """
+    op.create_table(
+        "companies",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("reporting_status", sa.Enum("Active", "Inactive", "Pending", name="reporting_status"), nullable=False),
+        sa.Column("reporting_currency", sa.String(3), nullable=False),
+        sa.Column("fund", sa.String(100), nullable=False),
+        sa.Column("location_country", sa.String(100), nullable=False),
+        sa.Column("customer_type", sa.Enum("B2B", "B2C", "B2B2C", name="customer_type"), nullable=False),
+        sa.Column("revenue_type", sa.Enum("Subscription", "Transactional", "Hybrid", name="revenue_type"), nullable=False),
+        _amount("equity_raised", 15, nullable=True),
+        _amount("post_money_valuation", 15, nullable=True),
+        sa.Column("year_end_date", sa.Date(), nullable=False),
+        sa.Column("created_date", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("created_by", sa.String(100), nullable=False),
+        sa.Column("last_update_date", sa.DateTime()),
+        sa.Column("last_updated_by", sa.String(100)),
+    )
+
+    op.create_table(
+        "metrics_input",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True),
+        sa.Column("company_id", UUID(as_uuid=True), sa.ForeignKey("companies.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("currency", sa.String(3), nullable=False),
+        *(
+            sa.Column(name, sa.Float(), nullable=False)
+            for name in ("total_revenue", "recurring_revenue", "gross_profit", "sales_marketing_expense",
+                         "total_operating_expense", "ebitda", "net_income", "cash_burn", "cash_balance")
+        ),
+        sa.Column("debt_outstanding", sa.Float()),
+        sa.Column("employees", sa.Integer(), nullable=False),
+        sa.Column("customers", sa.Integer()),
+        sa.Column("fiscal_reporting_date", sa.Date(), nullable=False),
+        sa.Column("fiscal_reporting_quarter", sa.Integer(), nullable=False),
+        sa.Column("reporting_year", sa.Integer(), nullable=False),
+        sa.Column("reporting_quarter", sa.Integer(), nullable=False),
+    )
+
+    op.create_table(
+        "quarterly_reporting_financials",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True),
+        sa.Column("company_id", UUID(as_uuid=True), sa.ForeignKey("companies.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("currency", sa.String(3), nullable=False),
+        sa.Column("exchange_rate_used", sa.Numeric(10, 6), nullable=False),
+        _amount("total_revenue"),
+        _amount("recurring_revenue"),
+        _amount("gross_profit"),
+        _amount("debt_outstanding", nullable=True),
+        _amount("sales_marketing_expense"),
+        _amount("total_operating_expense"),
+        _amount("ebitda"),
+        _amount("net_income"),
+        _amount("cash_burn"),
+        _amount("cash_balance"),
+        sa.Column("fiscal_reporting_date", sa.Date(), nullable=False),
+        sa.Column("fiscal_reporting_quarter", sa.Integer(), nullable=False),
+        sa.Column("reporting_year", sa.Integer(), nullable=False),
+        sa.Column("reporting_quarter", sa.Integer(), nullable=False),
+        sa.Column("created_date", sa.Date(), nullable=False),
+        sa.Column("created_by", sa.String(100), nullable=False),
+        sa.Column("last_update_date", sa.Date()),
+        sa.Column("last_updated_by", sa.String(100)),
+        sa.CheckConstraint("currency ~ '^[A-Z]{3}$'", name="check_currency_format"),
+        sa.CheckConstraint("exchange_rate_used > 0", name="check_positive_exchange_rate"),
+        sa.CheckConstraint("fiscal_reporting_quarter BETWEEN 1 AND 4", name="check_fiscal_quarter_range"),
+        sa.CheckConstraint("reporting_quarter BETWEEN 1 AND 4", name="check_reporting_quarter_range"),
+        sa.CheckConstraint("reporting_year > 1900", name="check_reporting_year_range"),
+    )
+
+    op.create_table(
+        "reporting_metrics",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True),
+        sa.Column("company_id", UUID(as_uuid=True), sa.ForeignKey("companies.id"), nullable=False),
+        sa.Column("currency", sa.String(3), nullable=False),
+        _amount("enterprise_value", 20, nullable=True),
+        _amount("arr", 20, nullable=True),
+        _amount("recurring_percentage_revenue", 5, nullable=True),
+        _amount("revenue_per_fte", 20, nullable=True),
+        _amount("gross_profit_per_fte", 20, nullable=True),
+        _amount("employee_growth_rate", 5, nullable=True),
+        _amount("change_in_cash", 20, nullable=True),
+        _amount("revenue_growth", 5, nullable=True),
+        _amount("monthly_cash_burn", 20, nullable=True),
+        _amount("runway_months", 7, 1, nullable=True),
+        _amount("ev_by_equity_raised_plus_debt", 7, nullable=True),
+        _amount("sales_marketing_percentage_revenue", 5, nullable=True),
+        _amount("total_operating_percentage_revenue", 5, nullable=True),
+        _amount("gross_profit_margin", 5, nullable=True),
+        _amount("valuation_to_revenue", 7, nullable=True),
+        _amount("yoy_growth_revenue", 5, nullable=True),
+        _amount("yoy_growth_profit", 5, nullable=True),
+        _amount("yoy_growth_employees", 5, nullable=True),
+        _amount("yoy_growth_ltm_revenue", 5, nullable=True),
+        _amount("ltm_total_revenue", 20, nullable=True),
+        _amount("ltm_gross_profit", 20, nullable=True),
+        _amount("ltm_sales_marketing_expense", 20, nullable=True),
+        _amount("ltm_gross_margin", 5, nullable=True),
+        _amount("ltm_operating_expense", 20, nullable=True),
+        _amount("ltm_ebitda", 20, nullable=True),
+        _amount("ltm_net_income", 20, nullable=True),
+        _amount("ltm_ebitda_margin", 5, nullable=True),
+        _amount("ltm_net_income_margin", 5, nullable=True),
+        sa.Column("fiscal_reporting_date", sa.Date(), nullable=False),
+        sa.Column("fiscal_reporting_quarter", sa.Integer(), nullable=False),
+        sa.Column("reporting_year", sa.Integer(), nullable=False),
+        sa.Column("reporting_quarter", sa.Integer(), nullable=False),
+        sa.Column("created_date", sa.Date(), nullable=False),
+        sa.Column("created_by", sa.String(100), nullable=False),
+        sa.Column("last_update_date", sa.Date()),
+        sa.Column("last_updated_by", sa.String(100)),
+    )
+
+    # The tables are empty, so the indexes are built in the revision's transaction
+    for table, columns in INDEXES.items():
+        for column in columns:
+            op.create_index(f"ix_{table}_{column}", table, [column])
+
+
+def downgrade():
+    """
+    Downgrade database schema.
+
+    Drops the four tables, with their indexes, and the enum types of the companies table.
+
+    Requirements addressed:
+    - Database Migration Management (2. SYSTEM ARCHITECTURE/2.2 Component Description/2.2.2 Data Layer)
+    """
+    for table in ("reporting_metrics", "quarterly_reporting_financials", "metrics_input", "companies"):
+        op.drop_table(table)
+    for type_name in ENUM_TYPES:
+        op.execute(f"DROP TYPE {type_name}")
@@ -0,0 +1,48 @@
+"""generate uuid primary keys server side
+
+Revision ID: 0277a5efcb25
+Revises: f20c12446ca8
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0277a5efcb25'
+down_revision = 'f20c12446ca8'
+branch_labels = None
+depends_on = None
+
+# Tables whose UUID primary key is now generated by PostgreSQL on insert
+TABLES = ("companies", "metrics_input", "quarterly_reporting_financials")
+
+
+def upgrade():
+    """
+    Upgrade database schema.
+
+    Enables pgcrypto, which provides gen_random_uuid() on PostgreSQL versions before 13,
+    and makes it the default for the id column of each table.
+
+    Requirements addressed:
+    - Database Migration Management (2. SYSTEM ARCHITECTURE/2.2 Component Description/2.2.2 Data Layer)
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    for table in TABLES:
+        op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
+
+
+def downgrade():
+    """
+    Downgrade database schema.
+
+    Removes the id column defaults. The pgcrypto extension is left installed, as
+    other objects may depend on it.
+
+    Requirements addressed:
+    - Database Migration Management (2. SYSTEM ARCHITECTURE/2.2 Component Description/2.2.2 Data Layer)
+    """
+    for table in TABLES:
+        op.alter_column(table, "id", server_default=None)
@@ -0,0 +1,58 @@
+"""store metrics input margins
+
+Revision ID: aa1540ea16f3
+Revises: 0277a5efcb25
+Create Date: 2026-10-16 16:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'aa1540ea16f3'
+down_revision = '0277a5efcb25'
+branch_labels = None
+depends_on = None
+
+# Margin columns and the column each expresses as a percentage of total revenue
+MARGINS = {
+    "gross_margin": "gross_profit",
+    "recurring_revenue_percentage": "recurring_revenue",
+    "ebitda_margin": "ebitda",
+}
+
+
+def upgrade():
+    """
+    Upgrade database schema.
+
+    Adds the margins to metrics_input as stored generated columns, computed by
+    PostgreSQL whenever a row is written.
+
+    Requirements addressed:
+    - Database Migration Management (2. SYSTEM ARCHITECTURE/2.2 Component Description/2.2.2 Data Layer)
+    """
+    for name, column in MARGINS.items():
+        op.add_column(
+            "metrics_input",
+            sa.Column(
+                name,
+                sa.Numeric(),
+                sa.Computed(f"CASE WHEN total_revenue <> 0 THEN {column} / total_revenue * 100 ELSE 0 END",
+                            persisted=True),
+            ),
+        )
+
+
+def downgrade():
+    """
+    Downgrade database schema.
+
+    Drops the generated margin columns from metrics_input.
+
+    Requirements addressed:
+    - Database Migration Management (2. SYSTEM ARCHITECTURE/2.2 Component Description/2.2.2 Data Layer)
+    """
+    for name in MARGINS:
+        op.drop_column("metrics_input", name)
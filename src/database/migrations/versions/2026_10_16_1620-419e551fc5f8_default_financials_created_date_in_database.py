@@ -0,0 +1,41 @@
+"""default financials created date in database
+
+Revision ID: 419e551fc5f8
+Revises: aa1540ea16f3
+Create Date: 2026-10-16 16:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '419e551fc5f8'
+down_revision = 'aa1540ea16f3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Upgrade database schema.
+
+    Makes CURRENT_DATE the default for quarterly_reporting_financials.created_date,
+    which was previously filled in by the application.
+
+    Requirements addressed:
+    - Database Migration Management (2. SYSTEM ARCHITECTURE/2.2 Component Description/2.2.2 Data Layer)
+    """
+    op.alter_column("quarterly_reporting_financials", "created_date", server_default=sa.text("CURRENT_DATE"))
+
+
+def downgrade():
+    """
+    Downgrade database schema.
+
+    Removes the created_date default.
+
+    Requirements addressed:
+    - Database Migration Management (2. SYSTEM ARCHITECTURE/2.2 Component Description/2.2.2 Data Layer)
+    """
+    op.alter_column("quarterly_reporting_financials", "created_date", server_default=None)
@@ -0,0 +1,57 @@
+"""index reporting metrics by company period
+
+Revision ID: 1e3b52933a83
+Revises: 419e551fc5f8
+Create Date: 2026-10-16 16:30:00.000000
+
+"""
+
+from src.database.migrations.online_ddl import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision = '1e3b52933a83'
+down_revision = '419e551fc5f8'
+branch_labels = None
+depends_on = None
+
+# Single-column B-tree indexes replaced by the composite and BRIN indexes
+SINGLE_COLUMN_INDEXES = ("company_id", "reporting_year", "fiscal_reporting_date")
+
+
+def upgrade():
+    """
+    Upgrade database schema.
+
+    Replaces the single-column indexes on reporting_metrics with a composite index on
+    (company_id, reporting_year, reporting_quarter) and a BRIN index on
+    fiscal_reporting_date. The new indexes are built before the old ones are dropped.
+
+    Requirements addressed:
+    - Database Migration Management (2. SYSTEM ARCHITECTURE/2.2 Component Description/2.2.2 Data Layer)
+    """
+    create_index_concurrently(
+        "ix_reporting_metrics_company_period", "reporting_metrics",
+        ["company_id", "reporting_year", "reporting_quarter"],
+    )
+    create_index_concurrently(
+        "ix_reporting_metrics_fiscal_reporting_date_brin", "reporting_metrics",
+        ["fiscal_reporting_date"], postgresql_using="brin",
+    )
+    for column in SINGLE_COLUMN_INDEXES:
+        drop_index_concurrently(f"ix_reporting_metrics_{column}", "reporting_metrics")
+
+
+def downgrade():
+    """
+    Downgrade database schema.
+
+    Restores the single-column indexes and drops the composite and BRIN indexes.
+
+    Requirements addressed:
+    - Database Migration Management (2. SYSTEM ARCHITECTURE/2.2 Component Description/2.2.2 Data Layer)
+    """
+    for column in SINGLE_COLUMN_INDEXES:
+        create_index_concurrently(f"ix_reporting_metrics_{column}", "reporting_metrics", [column])
+    drop_index_concurrently("ix_reporting_metrics_fiscal_reporting_date_brin", "reporting_metrics")
+    drop_index_concurrently("ix_reporting_metrics_company_period", "reporting_metrics")
@@ -0,0 +1,57 @@
+"""cover reporting metrics ltm figures
+
+Revision ID: 8c00c0dc79ef
+Revises: 1e3b52933a83
+Create Date: 2026-10-16 16:40:00.000000
+
+"""
+from alembic import op
+
+from src.database.migrations.online_ddl import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision = '8c00c0dc79ef'
+down_revision = '1e3b52933a83'
+branch_labels = None
+depends_on = None
+
+INDEX = "ix_reporting_metrics_company_period"
+COLUMNS = ["company_id", "reporting_year", "reporting_quarter"]
+LTM_COLUMNS = ["ltm_total_revenue", "ltm_gross_margin", "ltm_ebitda_margin", "ltm_net_income_margin"]
+
+
+def _rebuild_index(**kwargs):
+    """
+    Build the company/period index again with the given options, keeping an index in
+    place throughout: the new one is built under a temporary name, the old one dropped,
+    and the new one renamed.
+    """
+    create_index_concurrently(f"{INDEX}_new", "reporting_metrics", COLUMNS, **kwargs)
+    drop_index_concurrently(INDEX, "reporting_metrics")
+    op.execute(f"ALTER INDEX {INDEX}_new RENAME TO {INDEX}")
+
+
+def upgrade():
+    """
+    Upgrade database schema.
+
+    Includes the LTM figures in the reporting_metrics company/period index, so reads
+    of those figures by company and period are index-only scans.
+
+    Requirements addressed:
+    - Database Migration Management (2. SYSTEM ARCHITECTURE/2.2 Component Description/2.2.2 Data Layer)
+    """
+    _rebuild_index(postgresql_include=LTM_COLUMNS)
+
+
+def downgrade():
+    """
+    Downgrade database schema.
+
+    Rebuilds the company/period index without the included LTM figures.
+
+    Requirements addressed:
+    - Database Migration Management (2. SYSTEM ARCHITECTURE/2.2 Component Description/2.2.2 Data Layer)
+    """
+    _rebuild_index()
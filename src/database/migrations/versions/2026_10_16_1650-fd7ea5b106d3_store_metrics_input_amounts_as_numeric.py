@@ -0,0 +1,78 @@
+"""store metrics input amounts as numeric
+
+Revision ID: fd7ea5b106d3
+Revises: 8c00c0dc79ef
+Create Date: 2026-10-16 16:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'fd7ea5b106d3'
+down_revision = '8c00c0dc79ef'
+branch_labels = None
+depends_on = None
+
+# Monetary columns of metrics_input, stored as double precision before this revision
+AMOUNT_COLUMNS = (
+    "total_revenue", "recurring_revenue", "gross_profit", "sales_marketing_expense",
+    "total_operating_expense", "ebitda", "net_income", "cash_burn", "cash_balance",
+    "debt_outstanding",
+)
+
+# Generated margin columns and the column each expresses as a percentage of total revenue
+MARGINS = {
+    "gross_margin": "gross_profit",
+    "recurring_revenue_percentage": "recurring_revenue",
+    "ebitda_margin": "ebitda",
+}
+
+
+def _retype_amounts(type_, cast):
+    """
+    Change the type of the monetary columns, dropping the generated margins while the
+    columns they read are altered and adding them back afterwards, so PostgreSQL
+    recomputes them from the converted values.
+    """
+    for name in MARGINS:
+        op.drop_column("metrics_input", name)
+    for column in AMOUNT_COLUMNS:
+        op.alter_column("metrics_input", column, type_=type_, postgresql_using=f"{column}::{cast}")
+    for name, column in MARGINS.items():
+        op.add_column(
+            "metrics_input",
+            sa.Column(
+                name,
+                sa.Numeric(),
+                sa.Computed(f"CASE WHEN total_revenue <> 0 THEN {column} / total_revenue * 100 ELSE 0 END",
+                            persisted=True),
+            ),
+        )
+
+
+def upgrade():
+    """
+    Upgrade database schema.
+
+    Converts the metrics_input monetary columns from double precision to
+    numeric(18, 2), so the stored amounts and the margins generated from them
+    are no longer subject to binary floating-point round-off.
+
+    Requirements addressed:
+    - Database Migration Management (2. SYSTEM ARCHITECTURE/2.2 Component Description/2.2.2 Data Layer)
+    """
+    _retype_amounts(sa.Numeric(18, 2), "numeric(18,2)")
+
+
+def downgrade():
+    """
+    Downgrade database schema.
+
+    Converts the metrics_input monetary columns back to double precision.
+
+    Requirements addressed:
+    - Database Migration Management (2. SYSTEM ARCHITECTURE/2.2 Component Description/2.2.2 Data Layer)
+    """
+    _retype_amounts(sa.Float(), "double precision")
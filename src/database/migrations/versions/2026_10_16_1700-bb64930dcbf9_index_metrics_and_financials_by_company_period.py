@@ -0,0 +1,60 @@
+"""index metrics and financials by company period
+
+Revision ID: bb64930dcbf9
+Revises: fd7ea5b106d3
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+
+from src.database.migrations.online_ddl import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision = 'bb64930dcbf9'
+down_revision = 'fd7ea5b106d3'
+branch_labels = None
+depends_on = None
+
+# Period columns leading each covering index, and the amounts it includes
+COLUMNS = ["company_id", "reporting_year", "reporting_quarter"]
+INCLUDED_COLUMNS = ["total_revenue", "recurring_revenue", "gross_profit", "ebitda"]
+
+# Single-column B-tree indexes replaced by the covering index, per table
+SINGLE_COLUMN_INDEXES = {
+    "metrics_input": ("company_id", "reporting_year", "reporting_quarter"),
+    "quarterly_reporting_financials": ("company_id",),
+}
+
+
+def upgrade():
+    """
+    Upgrade database schema.
+
+    Adds a covering index on (company_id, reporting_year, reporting_quarter) to
+    metrics_input and quarterly_reporting_financials and drops the single-column
+    indexes it replaces. The new indexes are built before the old ones are dropped.
+
+    Requirements addressed:
+    - Database Migration Management (2. SYSTEM ARCHITECTURE/2.2 Component Description/2.2.2 Data Layer)
+    """
+    for table, columns in SINGLE_COLUMN_INDEXES.items():
+        create_index_concurrently(
+            f"ix_{table}_company_period", table, COLUMNS, postgresql_include=INCLUDED_COLUMNS,
+        )
+        for column in columns:
+            drop_index_concurrently(f"ix_{table}_{column}", table)
+
+
+def downgrade():
+    """
+    Downgrade database schema.
+
+    Restores the single-column indexes and drops the covering indexes.
+
+    Requirements addressed:
+    - Database Migration Management (2. SYSTEM ARCHITECTURE/2.2 Component Description/2.2.2 Data Layer)
+    """
+    for table, columns in SINGLE_COLUMN_INDEXES.items():
+        for column in columns:
+            create_index_concurrently(f"ix_{table}_{column}", table, [column])
+        drop_index_concurrently(f"ix_{table}_company_period", table)
@@ -6,25 +6,70 @@ Requirements addressed:
   Implement a PostgreSQL database to store quarterly reporting metrics from portfolio companies
 """
 
-from src.database.models.company import Company
-from src.database.models.metrics_input import MetricsInput
-from src.database.models.reporting_financials import ReportingFinancials
-from src.database.models.reporting_metrics import ReportingMetrics
+import importlib
+from typing import Any
 
-__all__ = ["Company", "MetricsInput", "ReportingFinancials", "ReportingMetrics"]
+from sqlalchemy.orm import configure_mappers
 
-# Ensure all models are imported and accessible
-assert Company
-assert MetricsInput
-assert ReportingFinancials
-assert ReportingMetrics
+# Each model, or Core table, and the module defining it; the model modules are only
+# imported, and their tables built, when a model is first accessed (PEP 562)
+_MODELS = {
+    "Company": "src.database.models.company",
+    "MetricsInput": "src.database.models.metrics_input",
+    "ReportingFinancials": "src.database.models.reporting_financials",
+    "ReportingMetrics": "src.database.models.reporting_metrics",
+    "reporting_metrics_table": "src.database.models.reporting_metrics",
+}
+
+__all__ = list(_MODELS)
+
+_mappers_configured = False
+
+def _configure_models() -> None:
+    """
+    Imports every model and configures their mappers, once.
+
+    The models' relationships reference each other by name, so none of them is usable
+    until all are registered. Configuring here, on first access, keeps that work out of
+    the first query.
+    """
+    global _mappers_configured
+    if not _mappers_configured:
+        for module_name in _MODELS.values():
+            importlib.import_module(module_name)
+        configure_mappers()
+        _mappers_configured = True
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports a model from its module on first access and caches it.
+
+    Args:
+        name (str): The attribute being looked up on the package.
+
+    Returns:
+        Any: The model class.
+
+    Raises:
+        AttributeError: If the name is not a model of this package.
+    """
+    try:
+        module_name = _MODELS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    _configure_models()
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODELS))
 
 # Additional information for developers:
-# 1. This file imports all the database models from their respective modules.
+# 1. Models are imported lazily through _MODELS; the first model accessed imports them all
+#    and configures the mappers, since their relationships depend on each other.
 # 2. The __all__ list specifies which models should be exposed when importing from this package.
-# 3. The assert statements ensure that all models are properly imported and accessible.
-# 4. When adding new models, make sure to:
-#    a. Import the model at the top of this file
-#    b. Add the model name to the __all__ list
-#    c. Add an assert statement for the new model
-# 5. This structure allows for easy access to all models throughout the application by simply importing from src.database.models
\ No newline at end of file
+# 3. Code that needs every model registered on Base.metadata (init_db, Alembic's env.py)
+#    imports each model module explicitly.
+# 4. When adding new models, add the model name and its module to _MODELS.
+# 5. This structure allows for easy access to all models throughout the application by simply importing from src.database.models
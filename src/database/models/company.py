@@ -1,6 +1,6 @@
-from sqlalchemy import Column, String, UUID, Enum, DECIMAL, Date, DateTime
-from uuid import uuid4
+from sqlalchemy import Column, String, UUID, Enum, DECIMAL, Date, DateTime, bindparam, select, text
 from src.database.base import Base
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 # SQLAlchemy model version: ^1.4.0
@@ -16,7 +16,7 @@ class Company(Base):
     """
     __tablename__ = "companies"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"), index=True)
     name = Column(String(255), nullable=False, index=True)
     reporting_status = Column(Enum("Active", "Inactive", "Pending", name="reporting_status"), nullable=False)
     reporting_currency = Column(String(3), nullable=False)
@@ -32,6 +32,22 @@ class Company(Base):
     last_update_date = Column(DateTime, onupdate=func.now())
     last_updated_by = Column(String(100))
 
+    # Child records, loaded with one batched SELECT ... IN per collection for all the
+    # companies in a result instead of one query per company
+    metrics_inputs = relationship(
+        "MetricsInput", back_populates="company", cascade="all, delete-orphan",
+        passive_deletes=True, lazy="selectin"
+    )
+    reporting_financials = relationship(
+        "ReportingFinancials", back_populates="company", cascade="all, delete-orphan",
+        passive_deletes=True, lazy="selectin"
+    )
+    # Loaded only when accessed, or with selectinload() where a query needs it; every
+    # company accumulates metrics rows, so loading them with each Company would multiply reads
+    reporting_metrics = relationship(
+        "ReportingMetrics", back_populates="company", cascade="all, delete-orphan"
+    )
+
     def __init__(self, **kwargs):
         """
         Initializes a new Company instance
@@ -48,21 +64,29 @@ class Company(Base):
     def get_by_id(cls, session, company_id):
         """
         Retrieves a Company instance by its ID
+
+        Uses the primary key lookup, which returns an instance already in the
+        session's identity map without querying the database.
         """
-        return session.query(cls).filter(cls.id == company_id).first()
+        return session.get(cls, company_id)
 
     @classmethod
     def get_by_name(cls, session, company_name):
         """
         Retrieves a Company instance by its name
         """
-        return session.query(cls).filter(cls.name == company_name).first()
+        return session.execute(_SELECT_BY_NAME, {"company_name": company_name}).scalars().first()
 
     def update(self, **kwargs):
         """
         Updates the Company instance with the provided keyword arguments
         """
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
-        return self
\ No newline at end of file
+        for key in kwargs.keys() & self._UPDATABLE:
+            setattr(self, key, kwargs[key])
+        return self
+
+# Built once; its compiled form is reused from SQLAlchemy's statement cache on every call
+_SELECT_BY_NAME = select(Company).where(Company.name == bindparam("company_name")).limit(1)
+
+# Column names update() may assign, computed once rather than probed with hasattr per key
+Company._UPDATABLE = frozenset(c.name for c in Company.__table__.columns)
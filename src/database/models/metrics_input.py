@@ -1,9 +1,21 @@
-from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey
+from sqlalchemy import Column, Computed, Integer, String, Numeric, Date, ForeignKey, Index, select, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import relationship, Session
 from src.database.base import Base
-import uuid
-from typing import Optional
+from typing import List
+
+def _margin_expression(column: str) -> str:
+    """
+    Returns the SQL expression for a column as a percentage of total revenue.
+
+    Args:
+        column (str): Name of the column to express as a percentage.
+
+    Returns:
+        str: The generated column expression.
+    """
+    return f"CASE WHEN total_revenue <> 0 THEN {column} / total_revenue * 100 ELSE 0 END"
 
 class MetricsInput(Base):
     """
@@ -18,109 +30,62 @@ class MetricsInput(Base):
 
     __tablename__ = "metrics_input"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
-    company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, index=True, server_default=text("gen_random_uuid()"))
+    company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
     currency = Column(String(3), nullable=False)
-    total_revenue = Column(Float, nullable=False)
-    recurring_revenue = Column(Float, nullable=False)
-    gross_profit = Column(Float, nullable=False)
-    sales_marketing_expense = Column(Float, nullable=False)
-    total_operating_expense = Column(Float, nullable=False)
-    ebitda = Column(Float, nullable=False)
-    net_income = Column(Float, nullable=False)
-    cash_burn = Column(Float, nullable=False)
-    cash_balance = Column(Float, nullable=False)
-    debt_outstanding = Column(Float)
+    total_revenue = Column(Numeric(18, 2), nullable=False)
+    recurring_revenue = Column(Numeric(18, 2), nullable=False)
+    gross_profit = Column(Numeric(18, 2), nullable=False)
+    sales_marketing_expense = Column(Numeric(18, 2), nullable=False)
+    total_operating_expense = Column(Numeric(18, 2), nullable=False)
+    ebitda = Column(Numeric(18, 2), nullable=False)
+    net_income = Column(Numeric(18, 2), nullable=False)
+    cash_burn = Column(Numeric(18, 2), nullable=False)
+    cash_balance = Column(Numeric(18, 2), nullable=False)
+    debt_outstanding = Column(Numeric(18, 2))
     employees = Column(Integer, nullable=False)
     customers = Column(Integer)
     fiscal_reporting_date = Column(Date, nullable=False, index=True)
     fiscal_reporting_quarter = Column(Integer, nullable=False)
-    reporting_year = Column(Integer, nullable=False, index=True)
-    reporting_quarter = Column(Integer, nullable=False, index=True)
+    reporting_year = Column(Integer, nullable=False)
+    reporting_quarter = Column(Integer, nullable=False)
+
+    # Percentages of total revenue (0 when there is no revenue), computed by PostgreSQL
+    # when the row is written
+    gross_margin = Column(Numeric, Computed(_margin_expression("gross_profit"), persisted=True))
+    recurring_revenue_percentage = Column(Numeric, Computed(_margin_expression("recurring_revenue"), persisted=True))
+    ebitda_margin = Column(Numeric, Computed(_margin_expression("ebitda"), persisted=True))
 
     # Relationship with the Company model
     company = relationship("Company", back_populates="metrics_inputs")
 
-    def __init__(self, company_id: uuid.UUID, currency: str, total_revenue: float,
-                 recurring_revenue: float, gross_profit: float, sales_marketing_expense: float,
-                 total_operating_expense: float, ebitda: float, net_income: float, cash_burn: float,
-                 cash_balance: float, employees: int, fiscal_reporting_date: Date,
-                 fiscal_reporting_quarter: int, reporting_year: int, reporting_quarter: int,
-                 id: Optional[uuid.UUID] = None, debt_outstanding: Optional[float] = None,
-                 customers: Optional[int] = None):
-        """
-        Initializes a new MetricsInput instance.
-
-        Args:
-            company_id (uuid.UUID): Foreign key referencing the associated company.
-            currency (str): The currency used for financial values.
-            total_revenue (float): Total revenue for the reporting period.
-            recurring_revenue (float): Recurring revenue for the reporting period.
-            gross_profit (float): Gross profit for the reporting period.
-            sales_marketing_expense (float): Sales and marketing expenses for the reporting period.
-            total_operating_expense (float): Total operating expenses for the reporting period.
-            ebitda (float): Earnings Before Interest, Taxes, Depreciation, and Amortization.
-            net_income (float): Net income for the reporting period.
-            cash_burn (float): Cash burn rate for the reporting period.
-            cash_balance (float): Cash balance at the end of the reporting period.
-            employees (int): Number of employees at the end of the reporting period.
-            fiscal_reporting_date (Date): The date of the fiscal report.
-            fiscal_reporting_quarter (int): The fiscal quarter of the report.
-            reporting_year (int): The year of the report.
-            reporting_quarter (int): The quarter of the report.
-            id (Optional[uuid.UUID]): Unique identifier for the metrics input record. If not provided, a new UUID will be generated.
-            debt_outstanding (Optional[float]): Outstanding debt at the end of the reporting period.
-            customers (Optional[int]): Number of customers at the end of the reporting period.
-        """
-        self.id = id or uuid.uuid4()
-        self.company_id = company_id
-        self.currency = currency
-        self.total_revenue = total_revenue
-        self.recurring_revenue = recurring_revenue
-        self.gross_profit = gross_profit
-        self.sales_marketing_expense = sales_marketing_expense
-        self.total_operating_expense = total_operating_expense
-        self.ebitda = ebitda
-        self.net_income = net_income
-        self.cash_burn = cash_burn
-        self.cash_balance = cash_balance
-        self.debt_outstanding = debt_outstanding
-        self.employees = employees
-        self.customers = customers
-        self.fiscal_reporting_date = fiscal_reporting_date
-        self.fiscal_reporting_quarter = fiscal_reporting_quarter
-        self.reporting_year = reporting_year
-        self.reporting_quarter = reporting_quarter
+    # Company/period lookups are answered by an index-only scan of this covering index;
+    # company_id leads it, so it also serves lookups by company_id alone
+    __table_args__ = (
+        Index(
+            'ix_metrics_input_company_period', 'company_id', 'reporting_year', 'reporting_quarter',
+            postgresql_include=['total_revenue', 'recurring_revenue', 'gross_profit', 'ebitda'],
+        ),
+    )
 
     def __repr__(self):
         return f"<MetricsInput(id={self.id}, company_id={self.company_id}, fiscal_reporting_date={self.fiscal_reporting_date}, reporting_year={self.reporting_year}, reporting_quarter={self.reporting_quarter})>"
 
-    @property
-    def gross_margin(self) -> float:
+    @classmethod
+    def compute_margins(cls, session: Session) -> List[Row]:
         """
-        Calculates the gross margin as a percentage.
+        Fetches the gross margin, recurring revenue percentage and EBITDA margin of every
+        metrics input record in a single query.
 
-        Returns:
-            float: The gross margin as a percentage.
-        """
-        return (self.gross_profit / self.total_revenue) * 100 if self.total_revenue != 0 else 0
+        The margins are stored generated columns, so this is a plain column scan and
+        reports covering many records do not need to load the ORM objects.
 
-    @property
-    def recurring_revenue_percentage(self) -> float:
-        """
-        Calculates the recurring revenue as a percentage of total revenue.
-
-        Returns:
-            float: The recurring revenue percentage.
-        """
-        return (self.recurring_revenue / self.total_revenue) * 100 if self.total_revenue != 0 else 0
-
-    @property
-    def ebitda_margin(self) -> float:
-        """
-        Calculates the EBITDA margin as a percentage.
+        Args:
+            session (Session): The database session to run the query on.
 
         Returns:
-            float: The EBITDA margin as a percentage.
+            List[Row]: One row per record with id, gross_margin, recurring_revenue_percentage
+            and ebitda_margin.
         """
-        return (self.ebitda / self.total_revenue) * 100 if self.total_revenue != 0 else 0
\ No newline at end of file
+        stmt = select(cls.id, cls.gross_margin, cls.recurring_revenue_percentage, cls.ebitda_margin)
+        return session.execute(stmt).all()
@@ -8,12 +8,11 @@ Requirements addressed:
 4. Audit Trail (1.2 Scope/Core Functionalities/5. Audit Trail)
 """
 
-from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, Numeric, CheckConstraint
+from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, Numeric, CheckConstraint, Index, func, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
+import operator
 from src.database.base import Base
-from datetime import date
 
 class ReportingFinancials(Base):
     """
@@ -25,8 +24,8 @@ class ReportingFinancials(Base):
 
     __tablename__ = "quarterly_reporting_financials"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"), index=True)
+    company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
     currency = Column(String(3), nullable=False)
     exchange_rate_used = Column(Numeric(10, 6), nullable=False)
     total_revenue = Column(Numeric(18, 2), nullable=False)
@@ -43,9 +42,9 @@ class ReportingFinancials(Base):
     fiscal_reporting_quarter = Column(Integer, nullable=False)
     reporting_year = Column(Integer, nullable=False)
     reporting_quarter = Column(Integer, nullable=False)
-    created_date = Column(Date, nullable=False, default=date.today)
+    created_date = Column(Date, nullable=False, server_default=func.current_date())
     created_by = Column(String(100), nullable=False)
-    last_update_date = Column(Date)
+    last_update_date = Column(Date, onupdate=func.current_date())
     last_updated_by = Column(String(100))
 
     # Relationships
@@ -58,6 +57,12 @@ class ReportingFinancials(Base):
         CheckConstraint('fiscal_reporting_quarter BETWEEN 1 AND 4', name='check_fiscal_quarter_range'),
         CheckConstraint('reporting_quarter BETWEEN 1 AND 4', name='check_reporting_quarter_range'),
         CheckConstraint('reporting_year > 1900', name='check_reporting_year_range'),
+        # Covering index so company/period lookups are answered by an index-only scan;
+        # company_id leads it, so it also serves lookups by company_id alone
+        Index(
+            'ix_quarterly_reporting_financials_company_period', 'company_id', 'reporting_year', 'reporting_quarter',
+            postgresql_include=['total_revenue', 'recurring_revenue', 'gross_profit', 'ebitda'],
+        ),
     )
 
     def __init__(self, **kwargs):
@@ -91,15 +96,21 @@ class ReportingFinancials(Base):
         
         :return: Dictionary representation of the ReportingFinancials instance
         """
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        return dict(zip(self._COLUMN_NAMES, self._column_values(self)))
 
     def update(self, **kwargs):
         """
         Updates the ReportingFinancials instance with the provided keyword arguments.
+        last_update_date is set by the database when the change is flushed.
         
         :param kwargs: Key-value pairs to update
         """
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
-        self.last_update_date = date.today()
\ No newline at end of file
+        for key in kwargs.keys() & self._UPDATABLE:
+            setattr(self, key, kwargs[key])
+
+# Column names and a getter fetching all of them in one C-level call, built once for to_dict
+ReportingFinancials._COLUMN_NAMES = tuple(c.name for c in ReportingFinancials.__table__.columns)
+ReportingFinancials._column_values = operator.attrgetter(*ReportingFinancials._COLUMN_NAMES)
+
+# Column names update() may assign, checked with one set intersection instead of hasattr per key
+ReportingFinancials._UPDATABLE = frozenset(ReportingFinancials._COLUMN_NAMES)
@@ -8,11 +8,36 @@ Requirements addressed:
    Defines the schema for the reporting_metrics table with appropriate columns and relationships
 """
 
-from sqlalchemy import Column, ForeignKey, Integer, String, Date, Numeric, UUID
-from sqlalchemy.orm import relationship
-from uuid import uuid4
+import csv
+import io
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, Integer, String, Date, Numeric, UUID, bindparam, cast, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import joinedload, relationship, Session
+from sqlalchemy.util import await_only
 from src.database.base import Base
-from src.database.config import get_database_settings
+from src.database.uuidv7 import uuid7
+
+# Below this many rows an executemany is cheaper than setting up a COPY
+COPY_MIN_ROWS = 100
+
+def _int8_param(name: str, value: Any):
+    """
+    Binds a value compared with an integer column as ``CAST(... AS BIGINT)``.
+
+    Callers may pass whole-valued Decimals (from request data, say), which psycopg2 sends
+    as NUMERIC. Compared with NUMERIC, an integer column is cast for every row and its
+    index cannot be used; compared with int8 it can.
+
+    Args:
+        name (str): Name of the bound parameter.
+        value (Any): The integer value, as int or Decimal.
+
+    Returns:
+        The cast bound parameter.
+    """
+    return cast(bindparam(name, value), BigInteger())
 
 class ReportingMetrics(Base):
     """
@@ -20,11 +45,11 @@ class ReportingMetrics(Base):
     """
     __tablename__ = "reporting_metrics"
 
-    # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
+    # Primary key; time-ordered, so ingested rows are appended to the end of the index
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     
     # Foreign key to link with the company
-    company_id = Column(UUID(as_uuid=True), ForeignKey('companies.id'), nullable=False, index=True)
+    company_id = Column(UUID(as_uuid=True), ForeignKey('companies.id'), nullable=False)
     
     # Currency of the reported metrics
     currency = Column(String(3), nullable=False)
@@ -60,9 +85,9 @@ class ReportingMetrics(Base):
     ltm_net_income_margin = Column(Numeric(5, 2))
     
     # Reporting period information
-    fiscal_reporting_date = Column(Date, nullable=False, index=True)
+    fiscal_reporting_date = Column(Date, nullable=False)
     fiscal_reporting_quarter = Column(Integer, nullable=False)
-    reporting_year = Column(Integer, nullable=False, index=True)
+    reporting_year = Column(Integer, nullable=False)
     reporting_quarter = Column(Integer, nullable=False)
     
     # Audit fields
@@ -71,23 +96,144 @@ class ReportingMetrics(Base):
     last_update_date = Column(Date)
     last_updated_by = Column(String(100))
 
-    # Relationship with the Company model
-    company = relationship("Company", back_populates="reporting_metrics")
+    # Relationship with the Company model. Loading it lazily with SQL raises, so a
+    # query over many rows cannot issue one company SELECT per row; query sites load it
+    # with joinedload/selectinload. A company already in the session is still returned.
+    company = relationship("Company", back_populates="reporting_metrics", lazy="raise_on_sql")
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.id = uuid4()
+    # Company/period lookups match the composite index exactly, and it also serves
+    # lookups by company_id alone; the LTM figures dashboards read are included in it, so
+    # get_ltm_metrics is answered by an index-only scan. Rows are ingested roughly in
+    # reporting date order, so a BRIN index answers date range scans at a fraction of a
+    # B-tree's size.
+    __table_args__ = (
+        Index(
+            'ix_reporting_metrics_company_period', 'company_id', 'reporting_year', 'reporting_quarter',
+            postgresql_include=['ltm_total_revenue', 'ltm_gross_margin', 'ltm_ebitda_margin', 'ltm_net_income_margin'],
+        ),
+        Index('ix_reporting_metrics_fiscal_reporting_date_brin', 'fiscal_reporting_date', postgresql_using='brin'),
+    )
 
     def __repr__(self):
         return f"<ReportingMetrics(id={self.id}, company_id={self.company_id}, fiscal_reporting_date={self.fiscal_reporting_date})>"
 
-# Get database settings
-db_settings = get_database_settings()
+    @classmethod
+    def get_by_company_period(
+        cls, session: Session, company_id: Any, reporting_year: int, reporting_quarter: int
+    ) -> Optional["ReportingMetrics"]:
+        """
+        Fetches a company's reporting metrics for a period, with the company loaded in the
+        same query.
+
+        Args:
+            session (Session): The database session to run the query on.
+            company_id (Any): The company's id.
+            reporting_year (int): The reporting year.
+            reporting_quarter (int): The reporting quarter.
+
+        Returns:
+            Optional[ReportingMetrics]: The reporting metrics, or None if there are none for the period.
+        """
+        stmt = (
+            select(cls)
+            .options(joinedload(cls.company))
+            .where(
+                cls.company_id == company_id,
+                cls.reporting_year == _int8_param("reporting_year", reporting_year),
+                cls.reporting_quarter == _int8_param("reporting_quarter", reporting_quarter),
+            )
+        )
+        return session.execute(stmt).scalars().first()
+
+    @classmethod
+    def get_ltm_metrics(cls, session: Session, company_id: Any, reporting_year: int) -> List[Row]:
+        """
+        Fetches a company's last-twelve-months figures for each quarter of a year.
+
+        Only columns held in the company/period index are selected, so PostgreSQL reads
+        them from the index without visiting the table rows.
+
+        Args:
+            session (Session): The database session to run the query on.
+            company_id (Any): The company's id.
+            reporting_year (int): The reporting year.
+
+        Returns:
+            List[Row]: One row per quarter, in quarter order, with reporting_quarter,
+            ltm_total_revenue, ltm_gross_margin, ltm_ebitda_margin and ltm_net_income_margin.
+        """
+        stmt = (
+            select(
+                cls.reporting_quarter,
+                cls.ltm_total_revenue,
+                cls.ltm_gross_margin,
+                cls.ltm_ebitda_margin,
+                cls.ltm_net_income_margin,
+            )
+            .where(cls.company_id == company_id, cls.reporting_year == _int8_param("reporting_year", reporting_year))
+            .order_by(cls.reporting_quarter)
+        )
+        return session.execute(stmt).all()
+
+    @classmethod
+    def bulk_copy(cls, session: Session, rows: List[Dict[str, Any]]) -> None:
+        """
+        Inserts reporting metrics rows with PostgreSQL COPY rather than one INSERT per row.
+
+        Quarterly ingest writes many rows at once, and COPY streams them to the server in
+        a single statement. Batches of fewer than COPY_MIN_ROWS rows are sent as a Core
+        executemany on reporting_metrics_table instead, which skips the unit of work. Rows without an
+        id are given one up front, since COPY does not apply the column's Python-side
+        default. The rows are written on the session's connection, inside its current
+        transaction.
+
+        On psycopg2 the rows are sent as tab-separated CSV. On asyncpg (a synchronous
+        session running under run_sync) they are sent with asyncpg's binary COPY, so the
+        values must already be of the column types, e.g. UUID and Decimal.
+
+        Args:
+            session (Session): The database session to write on.
+            rows (List[Dict[str, Any]]): The rows to insert, keyed by column name.
+
+        Returns:
+            None
+        """
+        if not rows:
+            return
+        rows = [row if "id" in row else {**row, "id": uuid7()} for row in rows]
+        if len(rows) < COPY_MIN_ROWS:
+            session.connection().execute(reporting_metrics_table.insert(), rows)
+            return
+
+        records = [tuple(map(row.get, cls._COPY_COLUMNS)) for row in rows]
+        connection = session.connection()
+        if connection.dialect.driver == "asyncpg":
+            await_only(connection.connection.driver_connection.copy_records_to_table(
+                cls.__tablename__, records=records, columns=list(cls._COPY_COLUMNS)
+            ))
+            return
+
+        buffer = io.StringIO()
+        csv.writer(buffer, delimiter="\t", quoting=csv.QUOTE_MINIMAL).writerows(
+            [r"\N" if value is None else value for value in record] for record in records
+        )
+        buffer.seek(0)
+        cursor = connection.connection.cursor()
+        try:
+            cursor.copy_expert(cls._COPY_STATEMENT, buffer)
+        finally:
+            cursor.close()
+
+# The reporting_metrics Table, for Core statements that bypass the ORM unit of work,
+# e.g. conn.execute(reporting_metrics_table.insert(), rows) for bulk writes
+reporting_metrics_table = ReportingMetrics.__table__
 
-# Use database settings if needed
-# For example, to set table-specific options based on the environment:
-if db_settings.DATABASE_ECHO_SQL:
-    __table_args__ = {'mysql_engine': 'InnoDB'}
+# Columns written by bulk_copy, in table order, and the COPY statement for them
+ReportingMetrics._COPY_COLUMNS = tuple(c.name for c in ReportingMetrics.__table__.columns)
+ReportingMetrics._COPY_STATEMENT = (
+    f"COPY {ReportingMetrics.__tablename__} ({', '.join(ReportingMetrics._COPY_COLUMNS)}) "
+    "FROM STDIN WITH (FORMAT csv, DELIMITER E'\\t', NULL '\\N')"
+)
 
 """
 Additional notes for developers:
@@ -95,16 +241,19 @@ Additional notes for developers:
 1. The ReportingMetrics model represents the structure of the reporting_metrics table in the database.
 2. Each instance of this model corresponds to a row in the reporting_metrics table.
 3. The UUID type is used for the id and company_id fields to ensure global uniqueness.
-4. Indexes have been added to frequently queried columns (id, company_id, fiscal_reporting_date, reporting_year) to improve query performance.
+4. The id column is indexed, company/period lookups use a composite index on (company_id, reporting_year,
+   reporting_quarter) that also covers the LTM figures read by get_ltm_metrics, and fiscal_reporting_date
+   has a BRIN index for date range scans.
 5. The Numeric type is used for financial values, with appropriate precision and scale:
    - (20, 2) for large monetary values (e.g., enterprise_value, arr)
    - (5, 2) for percentage values
    - (7, 2) for ratios that might exceed 100
    - (7, 1) for runway_months to allow for longer runway periods
-6. The relationship with the Company model is defined using SQLAlchemy's relationship function.
-7. The __init__ method ensures that a new UUID is generated for each new instance.
+6. The relationship with the Company model raises instead of lazy loading with SQL; load it with
+   joinedload (single rows, as get_by_company_period does) or selectinload (lists).
+7. New rows are given a UUIDv7 id by the column default, unless one is supplied.
 8. The __repr__ method provides a string representation of the object for debugging purposes.
-9. Database-specific settings (e.g., mysql_engine) are applied conditionally based on the environment.
+   Bulk ingest goes through ReportingMetrics.bulk_copy, which writes the rows with COPY.
 
 When working with this model:
 - Ensure that all required fields are provided when creating new instances.
@@ -13,35 +13,137 @@ Requirements addressed:
 Version: 1.0.0
 """
 
-from src.database.schemas.company import (
-    Company,
-    CompanyCreate,
-    CompanyUpdate,
-    CompanyInDB,
-    CompanyBase,
-    CompanyInDBBase
-)
-from src.database.schemas.metrics_input import (
-    MetricsInput,
-    MetricsInputCreate,
-    MetricsInputUpdate,
-    MetricsInputInDB,
-    MetricsInputBase
-)
-from src.database.schemas.reporting_financials import (
-    ReportingFinancials,
-    ReportingFinancialsCreate,
-    ReportingFinancialsUpdate,
-    ReportingFinancialsInDB,
-    ReportingFinancialsBase
-)
-from src.database.schemas.reporting_metrics import (
-    ReportingMetrics,
-    ReportingMetricsCreate,
-    ReportingMetricsUpdate,
-    ReportingMetricsInDB,
-    ReportingMetricsBase
-)
+import importlib
+import re
+from copy import copy
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Optional, Type
+
+from pydantic import BaseModel, create_model, field_validator
+
+# Each schema and the module defining it; a schema module is only imported, and its
+# models built, when one of its schemas is first accessed (PEP 562)
+_SCHEMA_MODULES = {
+    "src.database.schemas.company": (
+        "Company", "CompanyCreate", "CompanyUpdate", "CompanyInDB", "CompanyBase", "CompanyInDBBase",
+    ),
+    "src.database.schemas.metrics_input": (
+        "MetricsInput", "MetricsInputCreate", "MetricsInputUpdate", "MetricsInputInDB", "MetricsInputBase",
+    ),
+    "src.database.schemas.reporting_financials": (
+        "ReportingFinancials", "ReportingFinancialsCreate", "ReportingFinancialsUpdate",
+        "ReportingFinancialsInDB", "ReportingFinancialsBase",
+    ),
+    "src.database.schemas.reporting_metrics": (
+        "ReportingMetrics", "ReportingMetricsCreate", "ReportingMetricsUpdate",
+        "ReportingMetricsInDB", "ReportingMetricsBase",
+    ),
+}
+_SCHEMAS = {name: module for module, names in _SCHEMA_MODULES.items() for name in names}
+
+_CURRENCY_CODE = re.compile(r"[A-Za-z]{3}\Z")
+
+@lru_cache(maxsize=1024)
+def normalize_currency(code: str) -> Optional[str]:
+    """
+    Normalizes a currency code for the schemas' currency validators.
+
+    Payloads repeat a handful of currency codes, so results are cached per input string.
+
+    Args:
+        code (str): The currency code as submitted.
+
+    Returns:
+        Optional[str]: The code upper-cased, or None if it is not a 3-letter alphabetic code.
+    """
+    return code.upper() if _CURRENCY_CODE.match(code) else None
+
+def optional_currency_validator(field: str, message: str) -> Any:
+    """
+    Builds the currency validator for an Update schema made by update_variant.
+
+    It accepts None, as an update may leave the currency unset, and otherwise
+    normalizes the code as the base schemas' currency validators do.
+
+    Args:
+        field (str): Name of the currency field.
+        message (str): Error message for a code that is not 3 letters.
+
+    Returns:
+        Any: The field validator, to pass to update_variant in validators.
+    """
+    def validate_currency(cls, v):
+        if v is None:
+            return v
+        code = normalize_currency(v)
+        if code is None:
+            raise ValueError(message)
+        return code
+    return field_validator(field)(validate_currency)
+
+def update_variant(
+    base: Type[BaseModel],
+    name: str,
+    exclude: Iterable[str] = (),
+    validators: Optional[Dict[str, Callable[..., Any]]] = None,
+) -> Type[BaseModel]:
+    """
+    Builds the Update schema for a base schema: the same fields, each optional and
+    defaulting to None, so a partial update validates only the fields it sets.
+
+    The fields keep their constraints and descriptions. The base's validators are not
+    inherited, as they expect every field to be set; pass any that should apply to the
+    update, written to accept None, in validators.
+
+    Args:
+        base (Type[BaseModel]): The schema to derive the update schema from.
+        name (str): Name of the new schema.
+        exclude (Iterable[str]): Fields of base that cannot be updated.
+        validators (Optional[Dict[str, Callable[..., Any]]]): Validators of the new schema, by name.
+
+    Returns:
+        Type[BaseModel]: The update schema.
+    """
+    excluded = frozenset(exclude)
+    fields = {}
+    for field_name, field in base.model_fields.items():
+        if field_name in excluded:
+            continue
+        optional = copy(field)
+        optional.default = None
+        optional.metadata = list(field.metadata)
+        fields[field_name] = (Optional[field.annotation], optional)
+    return create_model(
+        name,
+        __config__=base.model_config,
+        __module__=base.__module__,
+        __validators__=validators,
+        **fields,
+    )
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports a schema from its module on first access and caches it.
+
+    Args:
+        name (str): The attribute being looked up on the package.
+
+    Returns:
+        Any: The schema class.
+
+    Raises:
+        AttributeError: If the name is not a schema of this package.
+    """
+    try:
+        module_name = _SCHEMAS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_SCHEMAS))
 
 __all__ = [
     # Company schemas
@@ -96,11 +198,12 @@ def get_financials(financials_id: UUID) -> ReportingFinancials:
     # Implementation here
 
 Notes:
-- Ensure that all new schemas are added to this file when created.
-- Keep the imports organized by entity (Company, MetricsInput, etc.) for clarity.
+- Ensure that all new schemas are added to _SCHEMA_MODULES and __all__ when created.
+- Schemas are imported lazily; a schema module is only loaded when one of its schemas is used.
+- Update schemas are generated from their base schema with update_variant.
 - Update the __version__ when making changes to the schemas or this file.
 - Consider adding type hints in other parts of the application that use these schemas.
 
 Dependencies:
-- pydantic==1.10.7 (or the version specified in your requirements.txt)
+- pydantic==2.0.2 (or the version specified in your requirements.txt)
 """
\ No newline at end of file
@@ -1,8 +1,9 @@
 from uuid import UUID
 from datetime import datetime, date
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional
 from decimal import Decimal
+from src.database.schemas import normalize_currency, optional_currency_validator, update_variant
 
 class ReportingMetricsBase(BaseModel):
     company_id: UUID = Field(..., description="UUID of the associated company")
@@ -40,27 +41,28 @@ class ReportingMetricsBase(BaseModel):
     reporting_year: int = Field(..., ge=1900, le=2100, description="Reporting year")
     reporting_quarter: int = Field(..., ge=1, le=4, description="Reporting quarter (1-4)")
 
-    class Config:
-        orm_mode = True
-        allow_population_by_field_name = True
-        json_encoders = {
-            UUID: str,
-            datetime: lambda v: v.isoformat(),
-            date: lambda v: v.isoformat(),
-            Decimal: lambda v: float(v)
-        }
+    # UUIDs, dates and datetimes serialize to strings in JSON mode, and Decimals to their
+    # exact string form, as in the other schemas
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+    )
 
-    @validator('currency')
+    @field_validator('currency')
+    @classmethod
     def validate_currency(cls, v):
-        if len(v) != 3 or not v.isalpha():
+        code = normalize_currency(v)
+        if code is None:
             raise ValueError('Currency must be a 3-letter ISO 4217 code')
-        return v.upper()
+        return code
 
-class ReportingMetricsCreate(ReportingMetricsBase):
-    pass
+ReportingMetricsCreate = ReportingMetricsBase
 
-class ReportingMetricsUpdate(ReportingMetricsBase):
-    pass
+# Updates set any subset of the ReportingMetricsBase fields
+ReportingMetricsUpdate = update_variant(
+    ReportingMetricsBase, "ReportingMetricsUpdate",
+    validators={"validate_currency": optional_currency_validator('currency', 'Currency must be a 3-letter ISO 4217 code')},
+)
 
 class ReportingMetrics(ReportingMetricsBase):
     id: UUID = Field(..., description="Unique identifier for the reporting metrics entry")
@@ -71,15 +73,12 @@ class ReportingMetricsInDB(ReportingMetrics):
     last_update_date: Optional[datetime] = Field(None, description="Date and time of the last update")
     last_updated_by: Optional[str] = Field(None, min_length=1, max_length=100, description="User who last updated the entry")
 
-    class Config:
-        orm_mode = True
-        allow_population_by_field_name = True
-        json_encoders = {
-            UUID: str,
-            datetime: lambda v: v.isoformat(),
-            date: lambda v: v.isoformat(),
-            Decimal: lambda v: float(v)
-        }
+    # UUIDs, dates and datetimes serialize to strings in JSON mode, and Decimals to their
+    # exact string form, as in the other schemas
+    model_config = ConfigDict(
+        from_attributes=True,
+        populate_by_name=True,
+    )
 
 # Additional validators can be added here for complex business logic or data integrity checks
 
@@ -100,15 +99,15 @@ Notes:
 - UUID fields are used for unique identifiers
 - Date and datetime fields use Python's built-in types
 - Custom validators can be added for complex business logic
-- The Config class in each model enables ORM mode and customizes JSON encoding
+- The model_config of each model enables ORM mode and population by field name
 
 When using these models:
 - Ensure all required fields are provided when creating or updating records
 - Use appropriate data types, especially for financial calculations (Decimal)
-- Be aware of the automatic conversion of Decimal to float in JSON responses
+- Decimal values appear in JSON responses as exact strings, not floats
 - Consider adding additional validators for complex business rules or data integrity checks
 
 Dependencies:
-- pydantic==1.10.7
+- pydantic==2.0.2
 - python-dateutil==2.8.2
 """
\ No newline at end of file
@@ -8,10 +8,15 @@ Requirements addressed:
    - Configures database connection pooling and session management for optimal performance
 """
 
+import os
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Generator
 
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Connection
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
@@ -21,12 +26,25 @@ from src.database.config import get_database_settings
 # Get database settings based on the current environment
 db_settings = get_database_settings()
 
-# Create SQLAlchemy engine with connection pooling configuration
+# Alembic revision scripts, located independently of the working directory
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+# Create SQLAlchemy engine with connection pooling configuration. A request waits at
+# most DATABASE_POOL_TIMEOUT seconds for a connection when the pool and its overflow
+# are exhausted, and pre-ping replaces connections dropped by a server restart or
+# failover before they are handed out.
 engine = create_engine(
     db_settings.DATABASE_URL,
     pool_size=db_settings.DATABASE_POOL_SIZE,
     max_overflow=db_settings.DATABASE_MAX_CONNECTIONS - db_settings.DATABASE_POOL_SIZE,
     pool_recycle=db_settings.DATABASE_POOL_RECYCLE,
+    pool_timeout=db_settings.DATABASE_POOL_TIMEOUT,
+    pool_pre_ping=True,
+    # executemany INSERTs are sent as multi-row INSERT ... VALUES statements and
+    # executemany UPDATEs/DELETEs with psycopg2's execute_batch, a page per round trip
+    executemany_mode="values_plus_batch",
+    executemany_values_page_size=1000,
+    executemany_batch_page_size=500,
     echo=db_settings.DATABASE_ECHO_SQL
 )
 
@@ -53,17 +71,36 @@ def get_db() -> Generator[SessionLocal, None, None]:
     finally:
         db.close()
 
+def stamp_head(connection: Connection) -> None:
+    """
+    Record the latest migration revision in alembic_version without running any revision.
+
+    Tables created by Base.metadata.create_all already match the head revision, and
+    `alembic upgrade head` would otherwise replay the whole chain against them from the
+    baseline, failing on the first column or index that already exists.
+
+    Args:
+        connection (Connection): The connection the tables were created on.
+    """
+    config = Config()
+    config.set_main_option("script_location", MIGRATIONS_DIR)
+    MigrationContext.configure(connection).stamp(ScriptDirectory.from_config(config), "head")
+
 def init_db() -> None:
     """
     Initialize the database by creating all tables.
 
     This function should be called when setting up the application to ensure
-    all database tables are created based on the defined models.
+    all database tables are created based on the defined models. The database is
+    stamped with the head revision in the same transaction, so later migrations
+    apply on top of it with `alembic upgrade head`.
     """
     # Import all models here to ensure they are registered with the Base class
     from src.database.models import company, metrics_input, reporting_financials, reporting_metrics
 
-    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        Base.metadata.create_all(bind=connection)
+        stamp_head(connection)
 
 class AsyncDatabaseSession:
     """
@@ -76,6 +113,8 @@ class AsyncDatabaseSession:
             pool_size=db_settings.DATABASE_POOL_SIZE,
             max_overflow=db_settings.DATABASE_MAX_CONNECTIONS - db_settings.DATABASE_POOL_SIZE,
             pool_recycle=db_settings.DATABASE_POOL_RECYCLE,
+            pool_timeout=db_settings.DATABASE_POOL_TIMEOUT,
+            pool_pre_ping=True,
             echo=db_settings.DATABASE_ECHO_SQL
         )
         self.SessionLocal = sessionmaker(
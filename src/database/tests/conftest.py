@@ -7,12 +7,13 @@ Requirements addressed:
 """
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator, Dict, Any
 
 from src.database.config import get_database_settings
 from src.database.base import Base
+from src.database.session import stamp_head
 from src.database.models import Company, MetricsInput, ReportingFinancials, ReportingMetrics
 from src.database.schemas import (
     CompanyCreate,
@@ -40,10 +41,13 @@ def create_test_database():
     Create a test database and tables
     
     This function creates a new database engine using TEST_DATABASE_URL,
-    creates all tables defined in Base.metadata, and closes the engine connection.
+    creates all tables defined in Base.metadata, stamps the database with the head
+    migration revision, and closes the engine connection.
     """
     engine = create_engine(TEST_DATABASE_URL)
-    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        Base.metadata.create_all(bind=connection)
+        stamp_head(connection)
     engine.dispose()
 
 def drop_test_database():
@@ -51,10 +55,13 @@ def drop_test_database():
     Drop the test database and all its tables
     
     This function creates a new database engine using TEST_DATABASE_URL,
-    drops all tables defined in Base.metadata, and closes the engine connection.
+    drops all tables defined in Base.metadata and the alembic_version table, and
+    closes the engine connection.
     """
     engine = create_engine(TEST_DATABASE_URL)
-    Base.metadata.drop_all(bind=engine)
+    with engine.begin() as connection:
+        Base.metadata.drop_all(bind=connection)
+        connection.execute(text("DROP TABLE IF EXISTS alembic_version"))
     engine.dispose()
 
 @pytest.fixture(scope="function")
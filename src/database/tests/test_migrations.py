@@ -32,12 +32,14 @@ def alembic_config():
 @pytest.fixture(scope="module", autouse=True)
 def setup_and_teardown_test_database(request):
     """
-    Fixture to set up the test database before running the tests and tear it down after.
+    Fixture to empty the test database before running the tests, so the migrations
+    build the schema from the baseline revision, and to restore it afterwards.
     """
-    create_test_database()
+    drop_test_database()
     
     def finalizer():
         drop_test_database()
+        create_test_database()
     
     request.addfinalizer(finalizer)
 
@@ -6,6 +6,9 @@ from src.database.models.metrics_input import MetricsInput
 from src.database.models.reporting_financials import ReportingFinancials
 from src.database.models.reporting_metrics import ReportingMetrics
 from datetime import date, datetime
+import time
+import uuid
+from src.database.uuidv7 import uuid7
 
 # Requirement: Data Model Testing
 # Location: 3. SYSTEM COMPONENTS ARCHITECTURE/3.2 SEQUENCE DIAGRAMS
@@ -458,4 +461,14 @@ def test_model_relationships(db_session):
     assert reporting_metrics in company.reporting_metrics
     assert reporting_metrics.company == company
 
+def test_uuid7_is_time_ordered():
+    """Test that uuid7 generates version 7 UUIDs that sort in creation order"""
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+
+    assert first.version == 7
+    assert first.variant == uuid.RFC_4122
+    assert first < second
+
 # Additional tests can be added here to cover more specific scenarios and edge cases
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+Time-ordered UUID generation for primary keys.
+
+Random (version 4) UUIDs land anywhere in a B-tree index, so each insert touches a
+random leaf page. Version 7 UUIDs start with a millisecond timestamp, so keys generated
+one after another sort together and new rows are appended near the right-hand edge of
+the index, as with a sequence.
+
+Requirements addressed:
+1. Database Schema (3. SYSTEM DESIGN/3.2 DATABASE DESIGN)
+   Provides primary key values that keep the reporting tables' indexes compact under bulk ingest
+"""
+
+import os
+import time
+from uuid import UUID
+
+def uuid7() -> UUID:
+    """
+    Generates a version 7 UUID as laid out in RFC 9562.
+
+    The 128 bits are a 48-bit Unix timestamp in milliseconds, the 4-bit version, 12
+    random bits, the 2-bit variant and 62 random bits.
+
+    Returns:
+        UUID: A new UUID whose ordering follows its creation time, to the millisecond.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    rand_a = rand >> 68
+    rand_b = rand & ((1 << 62) - 1)
+    value = (
+        (timestamp_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return UUID(int=value)